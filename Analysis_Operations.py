@@ -0,0 +1,35 @@
+from Edge_Filters import EdgeBank
+from Thresholding import AdaptiveThreshold, Otsu, local_threshold
+from Tiled_Processing import canny_tiled
+from Unsharp_Masking import UnsharpMask
+
+# The image-analysis chains behind the App.py windows, free of any Tk state
+# so that Batch_Processing.py (and anything else) can run them headless.
+
+
+def edge_filter(img, family, direction):
+    # The Sobel, Prewitt and Robertz windows show these very arrays
+    bank = EdgeBank(img, family)
+    if direction == 'magnitude':
+        return bank.display('magnitude')
+    return bank.filtered(direction)
+
+
+def canny(img, low, high):
+    return canny_tiled(img, int(low), int(high))
+
+
+def usm(img, size, sigma_x, sigma_y, K):
+    return UnsharpMask(img)(size, sigma_x, sigma_y, K)
+
+
+def adaptive_threshold(img, method, block_size, constant, max_value=255):
+    return AdaptiveThreshold(img, method)(block_size, constant, max_value)
+
+
+def sauvola_niblack(img, method, window, k, max_value=255):
+    return local_threshold(img, method, window, k, max_value)
+
+
+def otsu(img, size, low, high, classes=2):
+    return Otsu(img)(size, low, high, classes)
@@ -0,0 +1,213 @@
+"""Headless batch runner for the analysis operations of App.py.
+
+Applies one named operation to every image under a directory tree and
+writes the results to a mirrored tree, e.g.
+
+    python Batch_Processing.py sobel scenes/ edges/ --direction vertical
+    python Batch_Processing.py otsu scenes/ masks/ --band 4 --size 5 --workers 8
+    python Batch_Processing.py local scans/ binary/ --method sauvola --window 51
+    python Batch_Processing.py recipe shoot/ graded/ --recipe look.json
+    python Batch_Processing.py saltpepper clean/ noisy/ --salt 0.02 --pepper 0.02 --seed 1
+    python Batch_Processing.py gaussian clean/ noisy/ --sigma 15 --seed 1
+
+Files are spread over a pool of worker processes; each worker reads,
+processes and writes its own file, so nothing but timings travels back.
+"""
+import argparse
+import os
+import sys
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import cv2
+import numpy as np
+
+import Analysis_Operations as ops
+from Edge_Filters import EDGE_KERNELS
+from Edit_Recipe import Recipe, replay
+from Lazy_Raster import open_raster
+from Noise_Generation import gaussian_noise, salt_and_pepper
+from Thresholding import ADAPTIVE_METHODS, LOCAL_METHODS
+
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.tif', '.tiff', '.bmp')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Run an App.py analysis operation over a directory tree.")
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument('input', help="directory searched recursively for images")
+    common.add_argument('output', help="directory the results are written to (same layout)")
+    common.add_argument('--band', type=int, help="process only this band (1-based); default is every band")
+    common.add_argument('--workers', type=int, default=os.cpu_count(), help="worker processes")
+    common.add_argument('--ext', help="output file extension, e.g. .png (default: keep the input's)")
+    sub = parser.add_subparsers(dest='operation', required=True)
+
+    for family, kernels in EDGE_KERNELS.items():
+        p = sub.add_parser(family, parents=[common], help=family.capitalize() + " edge filter")
+        p.add_argument('--direction', choices=list(kernels) + ['magnitude'], default=list(kernels)[0])
+
+    p = sub.add_parser('canny', parents=[common], help="Canny edge detector")
+    p.add_argument('--low', type=int, default=50)
+    p.add_argument('--high', type=int, default=150)
+
+    p = sub.add_parser('usm', parents=[common], help="unsharp masking")
+    p.add_argument('--size', type=int, default=5, help="Gaussian kernel size (odd)")
+    p.add_argument('--sigma-x', type=float, default=1.0)
+    p.add_argument('--sigma-y', type=float, default=1.0)
+    p.add_argument('--amount', type=float, default=1.0, help="K, weight of the mask")
+
+    p = sub.add_parser('adaptive', parents=[common], help="adaptive thresholding")
+    p.add_argument('--method', choices=list(ADAPTIVE_METHODS), default='mean')
+    p.add_argument('--block-size', type=int, default=11, help="neighbourhood size (odd)")
+    p.add_argument('--constant', type=float, default=2)
+    p.add_argument('--max-value', type=float, default=255)
+
+    p = sub.add_parser('local', parents=[common], help="Sauvola or Niblack local thresholding")
+    p.add_argument('--method', choices=list(LOCAL_METHODS), default='sauvola')
+    p.add_argument('--window', type=int, default=25, help="neighbourhood size (odd)")
+    p.add_argument('--k', type=float, help="weight of the standard deviation (default: 0.2 Sauvola, -0.2 Niblack)")
+    p.add_argument('--max-value', type=float, default=255)
+
+    p = sub.add_parser('otsu', parents=[common], help="Gaussian blur + Otsu thresholding")
+    p.add_argument('--size', type=int, default=5, help="Gaussian kernel size (odd)")
+    p.add_argument('--low', type=int, default=0)
+    p.add_argument('--high', type=int, default=255)
+    p.add_argument('--classes', type=int, default=2,
+                   help="more than 2 labels the band into multi-level Otsu classes")
+
+    p = sub.add_parser('recipe', parents=[common], help="replay an edit recipe saved by Enhance_Image.py")
+    p.add_argument('--recipe', required=True, help="recipe .json file")
+
+    p = sub.add_parser('saltpepper', parents=[common], help="add salt-and-pepper noise")
+    p.add_argument('--salt', type=float, default=0.05, help="fraction of pixels set to the maximum")
+    p.add_argument('--pepper', type=float, default=0.05, help="fraction of pixels set to the minimum")
+    p.add_argument('--seed', type=int, help="make the noise reproducible (each file gets its own stream)")
+
+    p = sub.add_parser('gaussian', parents=[common], help="add Gaussian noise")
+    p.add_argument('--mean', type=float, default=0)
+    p.add_argument('--sigma', type=float, default=10)
+    p.add_argument('--seed', type=int, help="make the noise reproducible (each file gets its own stream)")
+    return parser
+
+
+def operation_for(args):
+    # A picklable (function, arguments) pair for the worker processes
+    if args.operation == 'recipe':
+        return replay, (Recipe.load(args.recipe).steps,)
+    if args.operation == 'saltpepper':
+        return salt_and_pepper, (args.salt, args.pepper)
+    if args.operation == 'gaussian':
+        return gaussian_noise, (args.mean, args.sigma)
+    if args.operation in EDGE_KERNELS:
+        return ops.edge_filter, (args.operation, args.direction)
+    if args.operation == 'canny':
+        return ops.canny, (args.low, args.high)
+    if args.operation == 'usm':
+        return ops.usm, (args.size, args.sigma_x, args.sigma_y, args.amount)
+    if args.operation == 'adaptive':
+        return ops.adaptive_threshold, (args.method, args.block_size, args.constant, args.max_value)
+    if args.operation == 'local':
+        return ops.sauvola_niblack, (args.method, args.window, args.k, args.max_value)
+    return ops.otsu, (args.size, args.low, args.high, args.classes)
+
+
+def find_images(root):
+    for folder, _, names in os.walk(root):
+        for name in sorted(names):
+            if name.lower().endswith(IMAGE_EXTENSIONS):
+                yield os.path.join(folder, name)
+
+
+def _bgr(result):
+    # open_raster decodes through PIL, in RGB(A) order; cv2.imwrite expects BGR(A)
+    if result.ndim == 3 and result.shape[2] == 3:
+        return cv2.cvtColor(result, cv2.COLOR_RGB2BGR)
+    if result.ndim == 3 and result.shape[2] == 4:
+        return cv2.cvtColor(result, cv2.COLOR_RGBA2BGRA)
+    return result
+
+
+def process_file(source, target, func, params, band, bgr=False, whole=False):
+    start = time.perf_counter()
+    if bgr:
+        # Recipes work on colour images the way the editor loads them
+        image = cv2.imread(source)
+        if image is None:
+            raise OSError("could not read " + source)
+        result = func(image, *params)
+    else:
+        image = open_raster(source)
+        if len(image.shape) == 2 or (whole and band is None):
+            result = func(np.asarray(image), *params)
+        elif band is not None:
+            result = func(image[:, :, band - 1], *params)
+        else:
+            result = np.dstack([func(image[:, :, b], *params) for b in range(image.shape[2])])
+    result = np.asarray(result)
+    if not bgr:
+        result = _bgr(result)
+
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    if not cv2.imwrite(target, result):
+        raise OSError("could not write " + target)
+    return time.perf_counter() - start, image.shape[0] * image.shape[1]
+
+
+def _init_worker():
+    # One file per process already uses every core; keep OpenCV single-threaded
+    cv2.setNumThreads(1)
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    func, params = operation_for(args)
+
+    jobs = []
+    for source in find_images(args.input):
+        target = os.path.join(args.output, os.path.relpath(source, args.input))
+        if args.ext:
+            target = os.path.splitext(target)[0] + args.ext
+        jobs.append((source, target))
+    if not jobs:
+        print("No images found under " + args.input)
+        return 1
+
+    # Noise is drawn for all bands of a pixel at once, from a stream per
+    # file keyed by its relative path, so a file gets the same noise
+    # whatever else is in the tree
+    whole = args.operation in ('saltpepper', 'gaussian')
+    seed = getattr(args, 'seed', None)
+
+    failed = 0
+    pixels = 0
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=args.workers, initializer=_init_worker) as pool:
+        futures = {}
+        for source, target in jobs:
+            file_params = params
+            if whole:
+                key = zlib.crc32(os.path.relpath(source, args.input).replace(os.sep, '/').encode())
+                file_params = params + (None if seed is None else (seed, key),)
+            futures[pool.submit(process_file, source, target, func, file_params, args.band,
+                                args.operation == 'recipe', whole)] = source
+        for future in as_completed(futures):
+            source = futures[future]
+            try:
+                seconds, count = future.result()
+            except Exception as error:
+                failed += 1
+                print("FAILED  {}: {}".format(source, error))
+                continue
+            pixels += count
+            print("{:8.3f} s  {:9.1f} MP/s  {}".format(seconds, count / seconds / 1e6, source))
+    elapsed = time.perf_counter() - start
+
+    done = len(jobs) - failed
+    print("{} of {} files in {:.2f} s: {:.2f} files/s, {:.1f} MP/s".format(
+        done, len(jobs), elapsed, done / elapsed, pixels / elapsed / 1e6))
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,59 @@
+import os
+import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
+
+# OpenCV and NumPy release the GIL inside their kernels, so plain threads are
+# enough to keep filtering off the Tk main thread.
+EXECUTOR = ThreadPoolExecutor(max_workers=os.cpu_count() or 1)
+
+POLL_MS = 15
+
+
+class BackgroundJob:
+    """Runs one window's computation on the worker pool.
+
+    submit() starts ``compute(*args)`` in the background and hands its result
+    to ``done`` on the Tk thread (via widget.after).  Submitting again while a
+    job is queued or running cancels it: a queued job never starts and the
+    result of a running one is dropped, so only the newest parameters are
+    ever drawn.  Exceptions from the worker are re-raised on the Tk thread.
+    """
+
+    def __init__(self, widget):
+        self.widget = widget
+        self._future = None
+        self._done = None
+
+    def submit(self, done, compute, *args, **kwargs):
+        self.cancel()
+        self._future = EXECUTOR.submit(compute, *args, **kwargs)
+        self._done = done
+        self._schedule_poll(self._future)
+        return self._future
+
+    def cancel(self):
+        if self._future is not None:
+            self._future.cancel()
+        self._future = None
+        self._done = None
+
+    def busy(self):
+        return self._future is not None and not self._future.done()
+
+    def _schedule_poll(self, future):
+        try:
+            self.widget.after(POLL_MS, self._poll, future)
+        except tk.TclError:
+            # The window is gone; nothing left to draw into
+            future.cancel()
+
+    def _poll(self, future):
+        if future is not self._future:
+            return
+        if not future.done():
+            self._schedule_poll(future)
+            return
+        done = self._done
+        self._future = None
+        self._done = None
+        done(future.result())
@@ -0,0 +1,324 @@
+import threading
+
+import numpy as np
+
+from Lazy_Import import lazy_module
+from Tiled_Processing import MEMORY_BUDGET, allocate, canny_tiled, run_tiled
+
+cv2 = lazy_module('cv2')
+
+# Directional kernels of the Robertz, Prewitt and Sobel windows, applied as
+# cv2.filter2D does (correlation, anchor at the centre, reflect-101 borders).
+# The Sobel horizontal and vertical planes are Gradient's derivatives instead,
+# which have the replicated borders of cv2.Canny.
+EDGE_KERNELS = {
+    'robertz': {
+        'x': np.array([[-1, 0], [0, 1]]),
+        'y': np.array([[0, -1], [1, 0]]),
+    },
+    'prewitt': {
+        'horizontal': np.array([[1, 1, 1], [0, 0, 0], [-1, -1, -1]]),
+        'vertical': np.array([[-1, 0, 1], [-1, 0, 1], [-1, 0, 1]]),
+        'ne': np.array([[0, 1, 1], [-1, 0, 1], [-1, -1, 0]]),
+        'nw': np.array([[-1, -1, 0], [-1, 0, 1], [0, 1, 1]]),
+    },
+    'sobel': {
+        'horizontal': np.array([[-1, -2, -1], [0, 0, 0], [1, 2, 1]]),
+        'vertical': np.array([[-1, 0, 1], [-2, 0, 2], [-1, 0, 1]]),
+        'ne': np.array([[0, 1, 2], [-1, 0, 1], [-2, -1, 0]]),
+        'nw': np.array([[-2, -1, 0], [-1, 0, 1], [0, 1, 2]]),
+    },
+}
+
+# Rank-1 kernels as (row kernel, column kernel): np.outer(column, row) is the
+# kernel above, and two 1-D passes replace the 3x3 one.  The diagonal and
+# Robertz kernels have rank 2 and go through filter2D.
+SEPARABLE = {
+    ('prewitt', 'horizontal'): (np.array([1, 1, 1]), np.array([1, 0, -1])),
+    ('prewitt', 'vertical'): (np.array([-1, 0, 1]), np.array([1, 1, 1])),
+    ('sobel', 'horizontal'): (np.array([1, 2, 1]), np.array([-1, 0, 1])),
+    ('sobel', 'vertical'): (np.array([-1, 0, 1]), np.array([1, 2, 1])),
+}
+
+# The (x, y) pair of each family that magnitude and orientation come from
+GRADIENT_PAIRS = {
+    'robertz': ('x', 'y'),
+    'prewitt': ('vertical', 'horizontal'),
+    'sobel': ('vertical', 'horizontal'),
+}
+
+# Sobel directions that are Gradient's own derivatives, by index in (dx, dy)
+SOBEL_DERIVATIVES = {'vertical': 0, 'horizontal': 1}
+
+
+def _depth(dtype):
+    # 8-bit bands fit every kernel's response in int16 exactly
+    return np.int16 if dtype == np.uint8 else np.float32
+
+
+class _Stack(list):
+    # The directions of one block, one array each; [crop] crops them all
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            return _Stack(plane[index] for plane in self)
+        return list.__getitem__(self, index)
+
+
+class _Planes:
+    # run_tiled output that keeps one contiguous array per direction
+    def __init__(self, count, shape, dtype, budget):
+        self.arrays = [allocate(shape, dtype, budget) for _ in range(count)]
+
+    def __setitem__(self, index, stack):
+        if index is Ellipsis:
+            # run_tiled's whole-image path: keep its arrays instead of copying
+            self.arrays = list(stack)
+            return
+        for array, plane in zip(self.arrays, stack):
+            array[index] = plane
+
+
+def _responses(block, family, directions, depth):
+    ddepth = cv2.CV_16S if depth == np.int16 else cv2.CV_32F
+    stack = _Stack()
+    for direction in directions:
+        factors = SEPARABLE.get((family, direction))
+        if factors is not None:
+            stack.append(cv2.sepFilter2D(block, ddepth, factors[0], factors[1]))
+        else:
+            stack.append(cv2.filter2D(block, ddepth, EDGE_KERNELS[family][direction]))
+    return stack
+
+
+def _saturate(plane, dtype):
+    # What filter2D(img, -1, kernel) stores: rounded and clipped to the input type
+    if dtype.kind in 'ui':
+        info = np.iinfo(dtype)
+        if plane.dtype.kind == 'f':
+            plane = np.rint(plane)
+        return np.clip(plane, info.min, info.max).astype(dtype)
+    return plane.astype(dtype)
+
+
+def _float_pair(dx, dy):
+    return np.asarray(dx, np.float32), np.asarray(dy, np.float32)
+
+
+def gradient_magnitude(dx, dy):
+    """sqrt(dx**2 + dy**2) as float32."""
+    return cv2.magnitude(*_float_pair(dx, dy))
+
+
+def gradient_orientation(dx, dy):
+    """Gradient direction in degrees, [0, 360), measured from +x towards +y (down)."""
+    return cv2.phase(*_float_pair(dx, dy), angleInDegrees=True)
+
+
+def magnitude_display(magnitude):
+    # Scaled so that the strongest edge is 255
+    return cv2.normalize(magnitude, None, 255, 0, cv2.NORM_INF, cv2.CV_8U)
+
+
+def orientation_display(orientation):
+    # 0..360 degrees onto 0..255
+    return cv2.convertScaleAbs(orientation, alpha=255 / 360)
+
+
+class EdgeBank:
+    """All directional responses of one image for one kernel family.
+
+    The first request runs every direction of the family over the image in
+    one tiled pass (each tile is read once and filtered while in cache, the
+    rank-1 kernels as two 1-D passes) and keeps the signed responses, int16
+    for 8-bit bands and float32 otherwise.  Switching direction afterwards
+    only clips a kept plane, and magnitude() / orientation() come from the
+    same planes.  Safe to use from several BackgroundJob workers at once.
+
+    The Sobel family does not filter its horizontal and vertical kernels
+    itself: they are the derivatives of ``gradient`` (a 3x3 Gradient of the
+    image, made if not given), so the Sobel window, its magnitude and
+    orientation buttons and Canny all share one derivative pass.
+    """
+
+    def __init__(self, image, family, budget=MEMORY_BUDGET, gradient=None):
+        self.image = image
+        self.family = family
+        self.directions = list(EDGE_KERNELS[family])
+        self.budget = budget
+        if family == 'sobel' and gradient is None:
+            gradient = Gradient(image, budget=budget)
+        self.gradient = gradient if family == 'sobel' else None
+        self._responses = None
+        self._filtered = {}
+        self._lock = threading.Lock()
+
+    @property
+    def responses(self):
+        with self._lock:
+            if self._responses is None:
+                responses = {}
+                own = self.directions
+                if self.gradient is not None:
+                    own = [d for d in self.directions if d not in SOBEL_DERIVATIVES]
+                    for direction, index in SOBEL_DERIVATIVES.items():
+                        responses[direction] = self.gradient.derivatives[index]
+                depth = _depth(self.image.dtype)
+                halo = max(max(EDGE_KERNELS[self.family][d].shape) for d in own) // 2
+                planes = _Planes(len(own), self.image.shape, depth, self.budget)
+                run_tiled(_responses, self.image, halo, self.family, own, depth, out=planes, dtype=depth,
+                          shape=tuple(self.image.shape) + (len(own),), budget=self.budget)
+                responses.update(zip(own, planes.arrays))
+                self._responses = {d: responses[d] for d in self.directions}
+            return self._responses
+
+    def response(self, direction):
+        """Signed response of one direction (int16 or float32)."""
+        return self.responses[direction]
+
+    def filtered(self, direction):
+        """cv2.filter2D(image, -1, kernel) for ``direction``.
+
+        The Sobel horizontal and vertical planes differ from it along the
+        image border only: they come from Gradient, with replicated borders.
+        """
+        result = self._filtered.get(direction)
+        if result is None:
+            result = _saturate(self.response(direction), np.dtype(self.image.dtype))
+            result.flags.writeable = False
+            self._filtered[direction] = result
+        return result
+
+    def _pair(self):
+        x, y = GRADIENT_PAIRS[self.family]
+        return self.response(x), self.response(y)
+
+    def magnitude(self):
+        if self.gradient is not None:
+            return self.gradient.magnitude()
+        return gradient_magnitude(*self._pair())
+
+    def orientation(self):
+        """Gradient direction in degrees, [0, 360), of the family's (x, y) pair."""
+        if self.gradient is not None:
+            return self.gradient.orientation()
+        return gradient_orientation(*self._pair())
+
+    def display(self, kind):
+        """A uint8 map of 'magnitude' or 'orientation', as Gradient.display() makes it."""
+        if self.gradient is not None:
+            return self.gradient.display(kind)
+        if kind == 'magnitude':
+            return magnitude_display(self.magnitude())
+        if kind == 'orientation':
+            return orientation_display(self.orientation())
+        raise ValueError("unknown gradient display: {!r}".format(kind))
+
+
+def _sobel_pair(block, ksize, depth):
+    # Replicated borders, as cv2.Canny uses for its own derivatives
+    ddepth = cv2.CV_16S if depth == np.int16 else cv2.CV_32F
+    return _Stack([cv2.Sobel(block, ddepth, 1, 0, ksize=ksize, borderType=cv2.BORDER_REPLICATE),
+                   cv2.Sobel(block, ddepth, 0, 1, ksize=ksize, borderType=cv2.BORDER_REPLICATE)])
+
+
+class Gradient:
+    """Sobel derivatives of one image, computed once and kept for reuse.
+
+    dx and dy stay signed: int16 for 8-bit input (the form cv2.Canny takes
+    directly, exact up to ksize 5) and float32 otherwise.  Magnitude,
+    orientation and the non-negative 8-bit display maps are derived from
+    them on first request and kept too, so the Sobel window, Canny and any
+    later Hough or corner step share one pair of derivative passes.
+    canny() runs only the non-maximum suppression and hysteresis of
+    cv2.Canny on the kept pair, so moving its thresholds repeats no filtering.
+    """
+
+    DISPLAYS = ('dx', 'dy', 'magnitude', 'orientation')
+
+    def __init__(self, image, ksize=3, budget=MEMORY_BUDGET):
+        self.image = image
+        self.ksize = ksize
+        self.budget = budget
+        self.depth = np.int16 if image.dtype == np.uint8 and ksize <= 5 else np.float32
+        self._derivatives = None
+        self._derived = {}
+        self._lock = threading.RLock()
+
+    @property
+    def derivatives(self):
+        with self._lock:
+            if self._derivatives is None:
+                planes = _Planes(2, self.image.shape, self.depth, self.budget)
+                run_tiled(_sobel_pair, self.image, self.ksize // 2, self.ksize, self.depth, out=planes,
+                          dtype=self.depth, shape=tuple(self.image.shape) + (2,), budget=self.budget)
+                self._derivatives = tuple(planes.arrays)
+            return self._derivatives
+
+    @property
+    def dx(self):
+        return self.derivatives[0]
+
+    @property
+    def dy(self):
+        return self.derivatives[1]
+
+    def canny(self, low, high):
+        """The same edges as cv2.Canny(image, low, high) with ksize as aperture."""
+        if self.depth != np.int16:
+            # cv2.Canny only takes int16 derivatives; let it judge the image itself
+            return canny_tiled(self.image, low, high, budget=self.budget, aperture=self.ksize)
+        return canny_tiled(self.derivatives, low, high, budget=self.budget)
+
+    def _derive(self, name, make):
+        with self._lock:
+            result = self._derived.get(name)
+            if result is None:
+                result = self._derived[name] = make()
+                result.flags.writeable = False
+            return result
+
+    def magnitude(self):
+        """sqrt(dx**2 + dy**2) as float32."""
+        return self._derive('magnitude', lambda: gradient_magnitude(*self.derivatives))
+
+    def orientation(self):
+        """Gradient direction in degrees, [0, 360), measured from +x towards +y (down)."""
+        return self._derive('orientation', lambda: gradient_orientation(*self.derivatives))
+
+    def display(self, kind):
+        """A uint8 map of ``kind`` (one of DISPLAYS) for showing or saving.
+
+        dx and dy are shown as |d| saturated at 255, magnitude is scaled so
+        its maximum is 255, and orientation maps 0..360 degrees to 0..255.
+        """
+        if kind in ('dx', 'dy'):
+            return self._derive('display_' + kind, lambda: cv2.convertScaleAbs(getattr(self, kind)))
+        if kind == 'magnitude':
+            return self._derive('display_magnitude', lambda: magnitude_display(self.magnitude()))
+        if kind == 'orientation':
+            return self._derive('display_orientation', lambda: orientation_display(self.orientation()))
+        raise ValueError("unknown gradient display: {!r}".format(kind))
+
+
+class GradientCache:
+    """The Gradient of each band of the image loaded by OPEN(), made on first use.
+
+    Indexed like BandCache; a single-band image has band 0 only.  Opening a
+    new image replaces the whole cache.
+    """
+
+    def __init__(self, image, ksize=3):
+        self.image = image
+        self.ksize = ksize
+        self.band_count = image.shape[2] if len(image.shape) > 2 else 1
+        self._bands = {}
+        self._lock = threading.Lock()
+
+    def band(self, band):
+        band = range(self.band_count)[band]
+        with self._lock:
+            gradient = self._bands.get(band)
+            if gradient is None:
+                pixels = self.image[:, :, band] if len(self.image.shape) > 2 else np.asarray(self.image)
+                gradient = self._bands[band] = Gradient(pixels, self.ksize)
+            return gradient
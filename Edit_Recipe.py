@@ -0,0 +1,80 @@
+import json
+
+from Image_Operations import (
+    average_blur, binary_threshold, black_and_white, brightness, crop, dilation, draw, emboss, erosion,
+    flip, gaussian_blur, median_blur, negative, rotate, saturation, sepia, sketch, stylisation, text)
+
+# A recipe is the list of steps the user applied in Enhance_Image.py, each a
+# JSON-friendly dict such as {'op': 'gaussian_blur', 'size': 5}; replaying
+# it on another image reproduces the same look without the GUI.
+
+# op name -> (function, image it starts from).  'edited' steps start from the
+# last applied image, 'original' ones from the uploaded image, and 'filtered'
+# ones build on the preview of the previous step, as they do in the GUI.
+STEPS = {
+    'negative': (negative, 'edited'),
+    'black_and_white': (black_and_white, 'edited'),
+    'stylisation': (stylisation, 'edited'),
+    'sketch': (sketch, 'edited'),
+    'emboss': (emboss, 'original'),
+    'sepia': (sepia, 'original'),
+    'binary_threshold': (binary_threshold, 'edited'),
+    'erosion': (erosion, 'edited'),
+    'dilation': (dilation, 'edited'),
+    'average_blur': (average_blur, 'edited'),
+    'gaussian_blur': (gaussian_blur, 'edited'),
+    'median_blur': (median_blur, 'edited'),
+    'brightness': (brightness, 'filtered'),
+    'saturation': (saturation, 'filtered'),
+    'rotate': (rotate, 'filtered'),
+    'flip': (flip, 'filtered'),
+    'crop': (crop, 'edited'),
+    'text': (text, 'edited'),
+    'draw': (draw, 'filtered'),
+}
+
+
+def step_source(step):
+    return STEPS[step['op']][1]
+
+
+def apply_step(step, img):
+    params = {key: value for key, value in step.items() if key != 'op'}
+    return STEPS[step['op']][0](img, **params)
+
+
+def replay(img, steps):
+    """Apply recorded steps to ``img`` (BGR, as read by cv2.imread)."""
+    original = current = img
+    for step in steps:
+        current = apply_step(step, original if step_source(step) == 'original' else current)
+    return current
+
+
+class Recipe:
+    """The steps committed with Apply since the image was uploaded or reverted."""
+
+    def __init__(self, steps=None):
+        self.steps = list(steps or [])
+
+    def record(self, steps):
+        self.steps.extend(dict(step) for step in steps)
+
+    def clear(self):
+        self.steps = []
+
+    def replay(self, img):
+        return replay(img, self.steps)
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            json.dump({'steps': self.steps}, f, indent=2)
+
+    @classmethod
+    def load(cls, path):
+        with open(path) as f:
+            data = json.load(f)
+        for step in data['steps']:
+            if step.get('op') not in STEPS:
+                raise ValueError("unknown recipe step: {!r}".format(step.get('op')))
+        return cls(data['steps'])
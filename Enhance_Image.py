@@ -2427,9 +2427,13 @@ import cv2
 from PIL import ImageTk, Image
 import numpy as np
 
+from Edit_Recipe import Recipe, apply_step, step_source
+
 class FrontEnd:
     def __init__(self, master):
         self.master = master
+        self.recipe = Recipe()
+        self.pending_steps = []
         self.menu_initialisation()
         
     def menu_initialisation(self):
@@ -2504,6 +2508,10 @@ class FrontEnd:
         ttk.Button(
             self.apply_and_cancel, text="Revert All Changes", command=self.revert_action).grid(
                 row=0, column=2, columnspan=1,padx=5, pady=5, sticky='sw')
+
+        ttk.Button(
+            self.apply_and_cancel, text="Save Recipe", command=self.save_recipe_action).grid(
+                row=0, column=3, columnspan=1,padx=5, pady=5, sticky='sw')
         
 
         
@@ -2514,6 +2522,8 @@ class FrontEnd:
 
         self.edited_image = cv2.imread(self.filename)
         self.filtered_image = cv2.imread(self.filename)
+        self.recipe.clear()
+        self.pending_steps = []
         self.display_image(self.edited_image)
 
     def text_action_1(self):
@@ -2576,11 +2586,7 @@ class FrontEnd:
             end_x = int(self.crop_start_x * self.ratio)
             end_y = int(self.crop_start_y * self.ratio)
 
-        x = slice(start_x, end_x, 1)
-        y = slice(start_y, end_y, 1)
-
-        self.filtered_image = self.edited_image[y, x]
-        self.display_image(self.filtered_image)
+        self.preview('crop', box=[start_x, start_y, end_x, end_y])
 
     def text_action(self):
         self.rectangle_id = 0
@@ -2621,9 +2627,7 @@ class FrontEnd:
         print(self.color_code)#((r,g,b),'#ff00000')
         r, g, b = tuple(map(int, self.color_code[0]))
 
-        self.filtered_image = cv2.putText(
-            self.edited_image, self.text_extracted, start_font, cv2.FONT_HERSHEY_SIMPLEX, 2, (b, g, r), 5)
-        self.display_image(self.filtered_image)
+        self.preview('text', text=self.text_extracted, position=list(start_font), color=[b, g, r])
 
     def draw_action(self):
         self.color_code = ((255, 0, 0), '#ff0000')
@@ -2642,15 +2646,22 @@ class FrontEnd:
         self.x = event.x
         self.y = event.y
         self.draw_ids = []
+        # Each stroke is one recorded step; draw on a copy so Cancel can drop it
+        self.draw_step = {'op': 'draw', 'lines': [], 'color': [0, 0, 255],
+                          'thickness': int(self.ratio * 2)}
+        self.pending_steps.append(self.draw_step)
+        self.filtered_image = self.filtered_image.copy()
 
     def draw(self, event):
         print(self.draw_ids)
         self.draw_ids.append(self.canvas.create_line(self.x, self.y, event.x, event.y, width=2,
                                                      fill=self.color_code[-1], capstyle=ROUND, smooth=True))
 
-        cv2.line(self.filtered_image, (int(self.x * self.ratio), int(self.y * self.ratio)),
-                 (int(event.x * self.ratio), int(event.y * self.ratio)),
-                 (0, 0, 255), thickness=int(self.ratio * 2),
+        line = [int(self.x * self.ratio), int(self.y * self.ratio),
+                int(event.x * self.ratio), int(event.y * self.ratio)]
+        self.draw_step['lines'].append(line)
+        cv2.line(self.filtered_image, (line[0], line[1]), (line[2], line[3]),
+                 (0, 0, 255), thickness=self.draw_step['thickness'],
                  lineType=8)
 
         self.x = event.x
@@ -2784,119 +2795,105 @@ class FrontEnd:
         cv2.imwrite(filename, save_as_image)
         self.filename = filename
     
-    def negative_action(self):
-        self.filtered_image = cv2.bitwise_not(self.edited_image)
+    def preview(self, op, **params):
+        # Run one recipe step; it stays pending until Apply commits it
+        step = dict(op=op, **params)
+        source = step_source(step)
+        if source == 'filtered':
+            self.pending_steps.append(step)
+            image = self.filtered_image
+        else:
+            self.pending_steps = [step]
+            image = self.original_image if source == 'original' else self.edited_image
+        self.filtered_image = apply_step(step, image)
         self.display_image(self.filtered_image)
 
+    def negative_action(self):
+        self.preview('negative')
+
     def bw_action(self):
-        self.filtered_image = cv2.cvtColor(
-            self.edited_image, cv2.COLOR_BGR2GRAY)
-        self.filtered_image = cv2.cvtColor(
-            self.filtered_image, cv2.COLOR_GRAY2BGR)
-        self.display_image(self.filtered_image)
+        self.preview('black_and_white')
 
     def stylisation_action(self):
-        self.filtered_image = cv2.stylization(
-            self.edited_image, sigma_s=150, sigma_r=0.25)
-        self.display_image(self.filtered_image)
+        self.preview('stylisation')
 
     def sketch_action(self):
-        ret, self.filtered_image = cv2.pencilSketch(
-            self.edited_image, sigma_s=60, sigma_r=0.5, shade_factor=0.02)
-        self.display_image(self.filtered_image)
+        self.preview('sketch')
 
     def emb_action(self):
-        kernel = np.array([[0, -1, -1],
-                           [1, 0, -1],
-                           [1, 1, 0]])
-        self.filtered_image = cv2.filter2D(self.original_image, -1, kernel)
-        self.display_image(self.filtered_image)
+        self.preview('emboss')
 
     def sepia_action(self):
-        kernel = np.array([[0.272, 0.534, 0.131],
-                           [0.349, 0.686, 0.168],
-                           [0.393, 0.769, 0.189]])
-
-        self.filtered_image = cv2.filter2D(self.original_image, -1, kernel)
-        self.display_image(self.filtered_image)
+        self.preview('sepia')
 
     def binary_threshold_action(self):
-        ret, self.filtered_image = cv2.threshold(
-            self.edited_image, 127, 255, cv2.THRESH_BINARY)
-        self.display_image(self.filtered_image)
+        self.preview('binary_threshold')
 
     def erosion_action(self):
-        kernel = np.ones((5, 5), np.uint8)
-        self.filtered_image = cv2.erode(
-            self.edited_image, kernel, iterations=1)
-        self.display_image(self.filtered_image)
+        self.preview('erosion')
 
     def dilation_action(self):
-        kernel = np.ones((5, 5), np.uint8)
-        self.filtered_image = cv2.dilate(
-            self.edited_image, kernel, iterations=1)
-        self.display_image(self.filtered_image)
+        self.preview('dilation')
     
     def averaging_action(self, value):
         value = int(value)
         if value % 2 == 0:
             value += 1
-        self.filtered_image = cv2.blur(self.edited_image, (value, value))
-        self.display_image(self.filtered_image)
+        self.preview('average_blur', size=value)
 
     def gaussian_action(self, value):
         value = int(value)
         if value % 2 == 0:
             value += 1
-        self.filtered_image = cv2.GaussianBlur(
-            self.edited_image, (value, value), 0)
-        self.display_image(self.filtered_image)
+        self.preview('gaussian_blur', size=value)
 
     def median_action(self, value):
         value = int(value)
         if value % 2 == 0:
             value += 1
-        self.filtered_image = cv2.medianBlur(self.edited_image, value)
-        self.display_image(self.filtered_image)
+        self.preview('median_blur', size=value)
     
     def brightness_action(self, value):
-        self.filtered_image = cv2.convertScaleAbs(
-            self.filtered_image, alpha=self.brightness_slider.get())
-        self.display_image(self.filtered_image)
+        self.preview('brightness', alpha=float(self.brightness_slider.get()))
 
     def saturation_action(self, event):
-        self.filtered_image = cv2.convertScaleAbs(
-            self.filtered_image, alpha=1, beta=self.saturation_slider.get())
-        self.display_image(self.filtered_image)
+        self.preview('saturation', beta=float(self.saturation_slider.get()))
     
     def rotate_left_action(self):
-        self.filtered_image = cv2.rotate(
-            self.filtered_image, cv2.ROTATE_90_COUNTERCLOCKWISE)
-        self.display_image(self.filtered_image)
+        self.preview('rotate', direction='left')
 
     def rotate_right_action(self):
-        self.filtered_image = cv2.rotate(
-            self.filtered_image, cv2.ROTATE_90_CLOCKWISE)
-        self.display_image(self.filtered_image)
+        self.preview('rotate', direction='right')
 
     def vertical_action(self):
-        self.filtered_image = cv2.flip(self.filtered_image, 0)
-        self.display_image(self.filtered_image)
+        self.preview('flip', code=0)
 
     def horizontal_action(self):
-        self.filtered_image = cv2.flip(self.filtered_image, 2)
-        self.display_image(self.filtered_image)
+        self.preview('flip', code=2)
     
     def apply_action(self):
         self.edited_image = self.filtered_image
+        self.recipe.record(self.pending_steps)
+        self.pending_steps = []
         self.display_image(self.edited_image)
 
     def cancel_action(self):
+        self.filtered_image = self.edited_image
+        self.pending_steps = []
         self.display_image(self.edited_image)
 
     def revert_action(self):
         self.edited_image = self.original_image.copy()
+        self.filtered_image = self.edited_image
+        self.recipe.clear()
+        self.pending_steps = []
         self.display_image(self.original_image)
+
+    def save_recipe_action(self):
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".json", filetypes=(("recipe files", "*.json"), ("all files", "*.*")))
+        if filename:
+            self.recipe.save(filename)
     
     def display_image(self, image=None):
         self.canvas.delete("all")
@@ -2930,6 +2927,7 @@ class FrontEnd:
         self.canvas.create_image(
             new_width / 2, new_height / 2,  image=self.new_image)
     
-mainWindow = Tk()
-FrontEnd(mainWindow)
-mainWindow.mainloop()
+if __name__ == '__main__':
+    mainWindow = Tk()
+    FrontEnd(mainWindow)
+    mainWindow.mainloop()
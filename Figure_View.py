@@ -0,0 +1,180 @@
+import tkinter as tk
+
+import numpy as np
+
+from Lazy_Import import lazy_module
+
+# Matplotlib loads with the first analysis window, not with App.py
+backend_bases = lazy_module('matplotlib.backend_bases')
+backend_tkagg = lazy_module('matplotlib.backends.backend_tkagg')
+figure = lazy_module('matplotlib.figure')
+transforms = lazy_module('matplotlib.transforms')
+
+
+class FigureView:
+    """The one figure, canvas and toolbar of an analysis window.
+
+    Widgets are created on the first reset() and then reused: pressing
+    "Select Band" again clears the figure instead of stacking a new canvas
+    and toolbar over the old ones.  Images go through image(), which keeps
+    one AxesImage per axes and swaps its pixels with set_data; blit() repaints
+    just those pixels when nothing else in the figure has changed.
+
+    Histograms are a single filled step patch (histogram()) rather than 256
+    bar rectangles, and threshold lines come from marker(): they are left out
+    of full redraws and painted over a saved copy of their axes, so move()
+    costs one restore and one line, not a re-layout of the histogram.
+    Sliders passed to track() are redrawn the same way: their bar, handle
+    and value text are blitted over their own strip instead of the slider
+    asking for a draw of the whole figure on every step.
+    """
+
+    def __init__(self, master, toolbar_xy, canvas_xy=(200, 0), figsize=(13, 7), **fig_kw):
+        self.master = master
+        self.toolbar_xy = toolbar_xy
+        self.canvas_xy = canvas_xy
+        self.fig = figure.Figure(figsize=figsize, **fig_kw)
+        self.canvas = None
+        self.toolbar = None
+        self._images = {}
+        self._histograms = {}
+        self._markers = {}
+        self._backgrounds = {}
+        self._sliders = {}
+        self._widgets = []
+        self._drawn = False
+
+    def reset(self):
+        if self.canvas is None:
+            self.canvas = backend_tkagg.FigureCanvasTkAgg(self.fig, self.master)
+            self.canvas.get_tk_widget().place(x=self.canvas_xy[0], y=self.canvas_xy[1])
+
+            toolbarFrame = tk.Frame(master=self.master)
+            toolbarFrame.place(x=self.toolbar_xy[0], y=self.toolbar_xy[1])
+            self.toolbar = backend_tkagg.NavigationToolbar2Tk(self.canvas, toolbarFrame)
+            self.toolbar.update()
+
+            self.canvas.mpl_connect("key_press_event", self.on_key_press)
+            self.canvas.mpl_connect("draw_event", self.on_draw)
+        else:
+            for widget in self._widgets:
+                widget.disconnect_events()
+            self.fig.clf()
+            self.draw()
+        self._images = {}
+        self._histograms = {}
+        self._markers = {}
+        self._backgrounds = {}
+        self._sliders = {}
+        self._widgets = []
+        return self.fig
+
+    def on_key_press(self, event):
+        print("you pressed {}".format(event.key))
+        backend_bases.key_press_handler(event, self.canvas, self.toolbar)
+
+    def on_draw(self, event):
+        # Grab each marked axes without its markers, then paint them on top
+        self._drawn = True
+        self._backgrounds = {}
+        for ax, markers in self._markers.items():
+            self._backgrounds[ax] = self.canvas.copy_from_bbox(ax.bbox)
+            for marker in markers:
+                ax.draw_artist(marker)
+        for slider, artists in self._sliders.items():
+            self._backgrounds[slider] = self.canvas.copy_from_bbox(self._slider_bbox(slider))
+            for artist in artists:
+                slider.ax.draw_artist(artist)
+
+    def track(self, widget):
+        # Sliders connect to the canvas; remember them so reset() can unhook them
+        self._widgets.append(widget)
+        artists = [getattr(widget, name, None) for name in ('poly', '_handle', 'valtext')]
+        if all(artist is not None for artist in artists):
+            # Without drawon, Slider.set_val no longer redraws the whole figure
+            widget.drawon = False
+            for artist in artists:
+                artist.set_animated(True)
+            self._sliders[widget] = artists
+            widget.on_changed(lambda val: self._redraw_slider(widget))
+        return widget
+
+    def _slider_bbox(self, slider):
+        # The slider's axes, the handle overhanging their ends and, up to the
+        # figure edge, the value text
+        box = slider.ax.bbox
+        text = slider.valtext.get_window_extent(self.canvas.get_renderer())
+        return transforms.Bbox.from_extents(box.x0 - box.height, min(box.y0, text.y0) - 1, self.fig.bbox.x1,
+                                            max(box.y1, text.y1) + 1)
+
+    def _redraw_slider(self, slider):
+        background = self._backgrounds.get(slider)
+        if background is None or not self._drawn:
+            self.draw()
+            return
+        self.canvas.restore_region(background)
+        for artist in self._sliders[slider]:
+            slider.ax.draw_artist(artist)
+        self.canvas.blit(self._slider_bbox(slider))
+
+    def image(self, ax, data, cmap='gray'):
+        artist = self._images.get(ax)
+        if artist is None or artist.get_array().shape != data.shape:
+            if artist is not None:
+                artist.remove()
+            artist = ax.imshow(data, cmap=cmap)
+            self._images[ax] = artist
+        else:
+            artist.set_data(data)
+            if data.ndim == 2:
+                artist.autoscale()
+        return artist
+
+    def histogram(self, ax, counts, **kwargs):
+        counts = np.asarray(counts).ravel()
+        patch = self._histograms.get(ax)
+        if patch is None:
+            edges = np.arange(counts.size + 1) - 0.5
+            patch = ax.stairs(counts, edges, fill=True, **kwargs)
+            self._histograms[ax] = patch
+        else:
+            patch.set_data(counts)
+        ax.set_ylim(0, max(1.0, float(counts.max())) * 1.05)
+        return patch
+
+    def marker(self, ax, x, **kwargs):
+        line = ax.axvline(x=x, animated=True, **kwargs)
+        self._markers.setdefault(ax, []).append(line)
+        return line
+
+    def move(self, line, x):
+        line.set_xdata([x, x])
+        ax = line.axes
+        background = self._backgrounds.get(ax)
+        if background is None or not self._drawn:
+            self.draw()
+            return
+        self.canvas.restore_region(background)
+        for marker in self._markers[ax]:
+            ax.draw_artist(marker)
+        self.canvas.blit(ax.bbox)
+
+    def refresh(self, ax, title=None, **title_kw):
+        # New pixels only need a blit; a new title means a full redraw
+        if title is not None and ax.get_title() != title:
+            ax.set_title(title, **title_kw)
+            self.draw()
+        else:
+            self.blit(ax)
+
+    def draw(self):
+        self._drawn = False
+        self.canvas.draw_idle()
+
+    def blit(self, ax):
+        artist = self._images.get(ax)
+        if artist is None or not self._drawn:
+            self.draw()
+            return
+        ax.draw_artist(artist)
+        self.canvas.blit(ax.bbox)
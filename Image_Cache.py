@@ -0,0 +1,196 @@
+import numpy as np
+
+from Lazy_Import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+
+class BandCache:
+    """Per-band histograms and statistics of the image loaded by OPEN().
+
+    A band is summarised the first time any window asks for it and the
+    result is kept; the windows only read from here.  Opening a new image
+    replaces the whole cache.  Bands are indexed from 0, like
+    ``Original_Image[:, :, band]``, and ``image`` may be a LazyRaster, in
+    which case only the bands that are looked at are ever read.
+    """
+
+    def __init__(self, image):
+        if not hasattr(image, 'band'):
+            image = np.asarray(image)
+        if image.ndim == 2:
+            image = image[:, :, np.newaxis]
+        self.image = image
+        self.band_count = image.shape[2]
+        self._summary = None
+        self._bands = {}
+        self.hist = _PerBand(self, 'hist')
+        self.cdf = _PerBand(self, 'cdf')
+        self.min = _PerBand(self, 'min')
+        self.max = _PerBand(self, 'max')
+        self.mean = _PerBand(self, 'mean')
+        self.std = _PerBand(self, 'std')
+
+    def band(self, band):
+        band = range(self.band_count)[band]
+        stats = self._bands.get(band)
+        if stats is None:
+            stats = self._bands[band] = _band_summary(np.ascontiguousarray(self.image[:, :, band]))
+        return stats
+
+    def histogram(self, band):
+        return self.band(band)['hist']
+
+    def cumulative(self, band):
+        return self.band(band)['cdf']
+
+    def summary(self):
+        # Full Staticks() table, computed on first use and kept with the cache
+        if self._summary is None:
+            if isinstance(self.image, np.ndarray):
+                self._summary = band_statistics(self.image)
+            else:
+                self._summary = [band_statistics(self.image[:, :, band])[0]
+                                 for band in range(self.band_count)]
+        return self._summary
+
+
+class _PerBand:
+    # Read-only list view of one field of every band, filled in on access
+
+    def __init__(self, cache, field):
+        self.cache = cache
+        self.field = field
+
+    def __len__(self):
+        return self.cache.band_count
+
+    def __getitem__(self, band):
+        return self.cache.band(band)[self.field]
+
+
+def _band_summary(channel):
+    hist = cv2.calcHist([channel], [0], None, [256], [0, 256])
+    stats = {'hist': hist, 'cdf': hist.cumsum()}
+    if channel.dtype == np.uint8:
+        # For 8-bit bands the histogram holds everything we need
+        counts = hist.ravel().astype(np.float64)
+        values = np.nonzero(counts)[0]
+        total = counts.sum()
+        mean = (counts * np.arange(256)).sum() / total
+        var = (counts * (np.arange(256) - mean) ** 2).sum() / total
+        stats.update(min=int(values[0]), max=int(values[-1]), mean=float(mean), std=float(np.sqrt(var)))
+    else:
+        low, high, _, _ = cv2.minMaxLoc(channel)
+        mean, std = cv2.meanStdDev(channel)
+        stats.update(min=low, max=high, mean=float(mean[0, 0]), std=float(std[0, 0]))
+    return stats
+
+
+# Rows of the Staticks() table are streamed through in chunks of about this
+# many bytes, so the working set stays fixed however large the raster is.
+CHUNK_BYTES = 32 * 1024 * 1024
+PERCENTILES = (1, 5, 25, 75, 95, 99)
+# Bins of the second pass that estimates percentiles of float and wide
+# integer bands, spread evenly over each band's [min, max]
+PERCENTILE_BINS = 1 << 16
+
+
+def _rank_value(cdf, rank, offset):
+    # Smallest value whose cumulative count exceeds the 0-based rank
+    return np.searchsorted(cdf, rank, side='right') + offset
+
+
+def _binned_value(counts, cdf, rank, low, width):
+    # Value of the 0-based rank, placed linearly inside the bin that holds it
+    index = min(int(np.searchsorted(cdf, rank, side='right')), len(cdf) - 1)
+    before = cdf[index - 1] if index else 0
+    inside = (rank - before + 0.5) / max(1, counts[index])
+    return low + width * (index + min(1.0, inside))
+
+
+def band_statistics(image, percentiles=PERCENTILES, chunk_bytes=CHUNK_BYTES):
+    """Min/max/mean/std/sum/median/percentiles of every band in one pass.
+
+    Moments are merged chunk by chunk (Chan/Welford update), so there is a
+    single read of the data.  Integer bands up to 16 bits also accumulate a
+    value histogram in the same pass, which gives exact medians and
+    percentiles.  Other types take a second chunked pass that bins each
+    band into PERCENTILE_BINS bins between its min and max, so their median
+    and percentiles are within (max - min) / PERCENTILE_BINS of the exact
+    ones; memory stays bounded by ``chunk_bytes`` either way.
+    """
+    image = np.asarray(image)
+    if image.ndim == 2:
+        image = image[:, :, np.newaxis]
+    height, width, bands = image.shape
+
+    counted = image.dtype.kind in 'ui' and image.dtype.itemsize <= 2
+    if counted:
+        offset = int(np.iinfo(image.dtype).min)
+        bins = int(np.iinfo(image.dtype).max) - offset + 1
+        counts = np.zeros((bands, bins), dtype=np.int64)
+
+    n = 0
+    mean = np.zeros(bands)
+    m2 = np.zeros(bands)
+    total = np.zeros(bands)
+    low = np.full(bands, np.inf)
+    high = np.full(bands, -np.inf)
+
+    rows = max(1, chunk_bytes // max(1, width * bands * 8))
+    for start in range(0, height, rows):
+        chunk = image[start:start + rows].reshape(-1, bands)
+        values = chunk.astype(np.float64)
+        k = values.shape[0]
+        chunk_mean = values.mean(axis=0)
+        chunk_m2 = ((values - chunk_mean) ** 2).sum(axis=0)
+        delta = chunk_mean - mean
+        mean = mean + delta * k / (n + k)
+        m2 = m2 + chunk_m2 + delta ** 2 * n * k / (n + k)
+        n += k
+        total += values.sum(axis=0)
+        np.minimum(low, values.min(axis=0), out=low)
+        np.maximum(high, values.max(axis=0), out=high)
+        if counted:
+            for band in range(bands):
+                counts[band] += np.bincount(chunk[:, band].astype(np.int64) - offset, minlength=bins)
+
+    if not counted:
+        width = (high - low) / PERCENTILE_BINS
+        binned = np.zeros((bands, PERCENTILE_BINS), dtype=np.int64)
+        for start in range(0, height, rows):
+            values = image[start:start + rows].reshape(-1, bands).astype(np.float64)
+            for band in range(bands):
+                index = (values[:, band] - low[band]) / width[band] if width[band] else np.zeros(len(values))
+                index = np.clip(index, 0, PERCENTILE_BINS - 1).astype(np.int64)
+                binned[band] += np.bincount(index, minlength=PERCENTILE_BINS)
+
+    stats = []
+    for band in range(bands):
+        if counted:
+            cdf = np.cumsum(counts[band])
+            levels = {}
+            for p in (50,) + tuple(percentiles):
+                rank = p / 100.0 * (n - 1)
+                below = _rank_value(cdf, np.floor(rank), offset)
+                above = _rank_value(cdf, np.ceil(rank), offset)
+                levels[p] = below + (above - below) * (rank - np.floor(rank))
+        else:
+            cdf = np.cumsum(binned[band])
+            levels = {}
+            for p in (50,) + tuple(percentiles):
+                rank = p / 100.0 * (n - 1)
+                below = _binned_value(binned[band], cdf, np.floor(rank), low[band], width[band])
+                above = _binned_value(binned[band], cdf, np.ceil(rank), low[band], width[band])
+                levels[p] = below + (above - below) * (rank - np.floor(rank))
+        stats.append({
+            'min': low[band],
+            'max': high[band],
+            'mean': mean[band],
+            'std': np.sqrt(m2[band] / n),
+            'sum': total[band],
+            'median': float(levels[50]),
+            'percentiles': {p: float(levels[p]) for p in percentiles},
+        })
+    return stats
@@ -1,11 +1,23 @@
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from tkinter import ttk
+import numpy as np
 from PIL import Image, ImageTk, ImageEnhance, ImageFilter
 
 
+def as_pil_image(pixels):
+    # Pixels already decoded by App.py: 1 band -> L, 3 -> RGB, 4 -> RGBA;
+    # two bands show the first, more than four show the first three.
+    if len(pixels.shape) == 3 and pixels.shape[2] not in (3, 4):
+        if pixels.shape[2] > 4:
+            pixels = np.dstack([pixels[:, :, band] for band in range(3)])
+        else:
+            pixels = pixels[:, :, 0]
+    return Image.fromarray(np.ascontiguousarray(pixels))
+
+
 class ImageEditorApp:
-    def __init__(self, root):
+    def __init__(self, root, image=None):
         self.root = root
         self.root.title("Image Editing App")
         self.root.geometry("1120x600")
@@ -36,7 +48,7 @@ class ImageEditorApp:
         tk.Button(root, text="Save", bg="green", command=self.save_image).place(x=50, y=450, width=100)
         tk.Button(root, text="Reset", bg="orange", command=self.reset_image).place(x=50, y=500, width=100)
         tk.Button(root, text="Undo", bg="blue", command=self.undo_last_change).place(x=50, y=550, width=100)
-        tk.Button(root, text="Exit", bg="red", command=root.quit).place(x=50, y=600, width=100)
+        tk.Button(root, text="Exit", bg="red", command=root.destroy).place(x=50, y=600, width=100)
 
         # Sliders for Adjustments
         self.brightness_slider = self.add_slider("Brightness", 80 , 450, lambda e: self.adjust_brightness())
@@ -67,6 +79,12 @@ class ImageEditorApp:
         self.height_entry.place(x=600, y=440)
         tk.Button(root, text="Apply", bg="pink", command=self.resize_image).place(x=500, y=470, width=100)
 
+        # Started from App.py with its image: edit that instead of browsing for a file
+        if image is not None:
+            self.image = image if isinstance(image, Image.Image) else as_pil_image(image)
+            self.edited_image = self.image.copy()
+            self.update_images()
+
     def add_slider(self, label, y, x_offset, command):
         tk.Label(self.root, text=label, bg="tan", font=("Arial", 10)).place(x=x_offset, y=y)
         slider = tk.Scale(self.root, from_=0, to=2, resolution=0.1, orient="horizontal", bg="tan", command=command)
@@ -101,9 +119,10 @@ class ImageEditorApp:
         canvas_width, canvas_height = canvas.winfo_width(), canvas.winfo_height()
         if canvas_width == 1 and canvas_height == 1:
             canvas_width, canvas_height = 300, 300  # Default for first display
-        scaled_image = image.copy()
-        scaled_image.thumbnail((canvas_width, canvas_height))
-        return scaled_image
+        # Same size as thumbnail(), but without copying the full-size image first
+        scale = min(canvas_width / image.width, canvas_height / image.height, 1)
+        size = (max(1, round(image.width * scale)), max(1, round(image.height * scale)))
+        return image.resize(size, reducing_gap=2.0)
 
     def update_images(self):
         if self.image:
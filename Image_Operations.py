@@ -0,0 +1,104 @@
+import numpy as np
+
+from Lazy_Import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+# The filters of the Enhance_Image.py editor as plain functions of a BGR
+# image (as read by cv2.imread).  Nothing here touches Tk or runs at import
+# beyond building three small kernels, so process-pool workers, servers and
+# batch jobs can import this module cheaply and share the GUI's code path.
+
+EMBOSS_KERNEL = np.array([[0, -1, -1],
+                          [1, 0, -1],
+                          [1, 1, 0]])
+
+SEPIA_KERNEL = np.array([[0.272, 0.534, 0.131],
+                         [0.349, 0.686, 0.168],
+                         [0.393, 0.769, 0.189]])
+
+MORPH_KERNEL = np.ones((5, 5), np.uint8)
+
+
+def negative(img):
+    return cv2.bitwise_not(img)
+
+
+def black_and_white(img):
+    gray = cv2.cvtColor(img, cv2.COLOR_BGR2GRAY)
+    return cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
+
+
+def stylisation(img):
+    return cv2.stylization(img, sigma_s=150, sigma_r=0.25)
+
+
+def sketch(img):
+    ret, sketched = cv2.pencilSketch(img, sigma_s=60, sigma_r=0.5, shade_factor=0.02)
+    return sketched
+
+
+def emboss(img):
+    return cv2.filter2D(img, -1, EMBOSS_KERNEL)
+
+
+def sepia(img):
+    return cv2.filter2D(img, -1, SEPIA_KERNEL)
+
+
+def binary_threshold(img):
+    ret, thresholded = cv2.threshold(img, 127, 255, cv2.THRESH_BINARY)
+    return thresholded
+
+
+def erosion(img):
+    return cv2.erode(img, MORPH_KERNEL, iterations=1)
+
+
+def dilation(img):
+    return cv2.dilate(img, MORPH_KERNEL, iterations=1)
+
+
+def average_blur(img, size):
+    return cv2.blur(img, (size, size))
+
+
+def gaussian_blur(img, size):
+    return cv2.GaussianBlur(img, (size, size), 0)
+
+
+def median_blur(img, size):
+    return cv2.medianBlur(img, size)
+
+
+def brightness(img, alpha):
+    return cv2.convertScaleAbs(img, alpha=alpha)
+
+
+def saturation(img, beta):
+    return cv2.convertScaleAbs(img, alpha=1, beta=beta)
+
+
+def rotate(img, direction):
+    code = cv2.ROTATE_90_COUNTERCLOCKWISE if direction == 'left' else cv2.ROTATE_90_CLOCKWISE
+    return cv2.rotate(img, code)
+
+
+def flip(img, code):
+    return cv2.flip(img, code)
+
+
+def crop(img, box):
+    start_x, start_y, end_x, end_y = box
+    return img[start_y:end_y, start_x:end_x]
+
+
+def text(img, text, position, color):
+    return cv2.putText(img.copy(), text, tuple(position), cv2.FONT_HERSHEY_SIMPLEX, 2, tuple(color), 5)
+
+
+def draw(img, lines, color, thickness):
+    img = img.copy()
+    for x0, y0, x1, y1 in lines:
+        cv2.line(img, (x0, y0), (x1, y1), tuple(color), thickness=thickness, lineType=8)
+    return img
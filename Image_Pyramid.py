@@ -0,0 +1,37 @@
+# Levels stop halving once the short side would drop below this
+MIN_SIZE = 64
+
+
+class ImagePyramid:
+    """Mipmaps of a PIL image for the resizable preview windows.
+
+    Level 0 is the image itself and every further level is half the size
+    of the previous one (2x2 box average).  resize() starts from the
+    smallest level that is still at least as large as the requested size,
+    so redrawing a window costs about the same whatever the resolution of
+    the loaded image.
+    """
+
+    def __init__(self, image, min_size=MIN_SIZE):
+        self.levels = [image]
+        level = image
+        while min(level.size) // 2 >= min_size:
+            try:
+                level = level.reduce(2)
+            except ValueError:
+                # Modes reduce() does not handle (e.g. I;16) keep one level
+                break
+            self.levels.append(level)
+
+    def level_for(self, width, height):
+        for level in reversed(self.levels):
+            if level.width >= width and level.height >= height:
+                return level
+        return self.levels[0]
+
+    def resize(self, width, height):
+        width, height = max(1, width), max(1, height)
+        level = self.level_for(width, height)
+        if level.size == (width, height):
+            return level
+        return level.resize((width, height))
@@ -0,0 +1,34 @@
+import importlib
+import sys
+
+# Startup of App.py should cost a Tk window and a splash image, not the
+# import time of OpenCV and Matplotlib: modules that only the analysis
+# windows need are bound with lazy_module() and loaded on first use.
+
+
+class LazyModule:
+    """Stand-in for a module that imports it on first attribute access.
+
+    Only the first lookup goes through importlib; later ones are a plain
+    getattr on the real module.  Submodules such as
+    ``matplotlib.backends.backend_tkagg`` defer their parent packages too.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def __getattr__(self, attr):
+        if self._module is None:
+            self._module = importlib.import_module(self._name)
+        return getattr(self._module, attr)
+
+    def __repr__(self):
+        state = 'loaded' if self._module is not None else 'not loaded'
+        return "<lazy module {!r} ({})>".format(self._name, state)
+
+
+def lazy_module(name):
+    """The module ``name`` if already imported, else a LazyModule for it."""
+    module = sys.modules.get(name)
+    return module if module is not None else LazyModule(name)
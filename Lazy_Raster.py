@@ -0,0 +1,196 @@
+import struct
+
+import numpy as np
+from PIL import Image
+
+# Baseline TIFF tags needed to locate the pixels of the first image
+IMAGE_WIDTH = 256
+IMAGE_LENGTH = 257
+BITS_PER_SAMPLE = 258
+COMPRESSION = 259
+PHOTOMETRIC = 262
+STRIP_OFFSETS = 273
+SAMPLES_PER_PIXEL = 277
+ROWS_PER_STRIP = 278
+STRIP_BYTE_COUNTS = 279
+PLANAR_CONFIG = 284
+TILE_WIDTH = 322
+TILE_LENGTH = 323
+TILE_OFFSETS = 324
+TILE_BYTE_COUNTS = 325
+SAMPLE_FORMAT = 339
+
+# TIFF field type -> (struct code, size); only integer types carry layout
+FIELD_TYPES = {1: ('B', 1), 3: ('H', 2), 4: ('I', 4), 8: ('h', 2), 9: ('i', 4), 16: ('Q', 8), 17: ('q', 8)}
+SAMPLE_KINDS = {1: 'u', 2: 'i', 3: 'f'}
+
+
+def read_tiff_tags(raw):
+    """Integer tags of the first IFD of a TIFF/BigTIFF, or None if not a TIFF."""
+    order = bytes(raw[:2])
+    if order not in (b'II', b'MM'):
+        return None
+    end = '<' if order == b'II' else '>'
+    magic = struct.unpack(end + 'H', bytes(raw[2:4]))[0]
+    if magic == 42:
+        offset = struct.unpack(end + 'I', bytes(raw[4:8]))[0]
+        count_fmt, entry_fmt, entry_size, inline = 'H', 'HHI4s', 12, 4
+    elif magic == 43:
+        offset = struct.unpack(end + 'Q', bytes(raw[8:16]))[0]
+        count_fmt, entry_fmt, entry_size, inline = 'Q', 'HHQ8s', 20, 8
+    else:
+        return None
+
+    count_size = struct.calcsize(count_fmt)
+    entries = struct.unpack(end + count_fmt, bytes(raw[offset:offset + count_size]))[0]
+    tags = {'byteorder': end}
+    for k in range(entries):
+        start = offset + count_size + k * entry_size
+        tag, kind, count, value = struct.unpack(end + entry_fmt, bytes(raw[start:start + entry_size]))
+        if kind not in FIELD_TYPES:
+            continue
+        code, size = FIELD_TYPES[kind]
+        if count * size > inline:
+            pointer = struct.unpack(end + ('I' if inline == 4 else 'Q'), value)[0]
+            value = bytes(raw[pointer:pointer + count * size])
+        tags[tag] = struct.unpack(end + code * count, value[:count * size])
+    return tags
+
+
+class LazyRaster:
+    """A multi-band raster whose pixels stay in the memory-mapped file.
+
+    Nothing is decoded when the file is opened.  ``raster[:, :, band]`` (or
+    band()) returns a read-only, C-contiguous 2-D array for that band,
+    built on first use and kept: for band-sequential (planar) strips it is
+    a view straight into the mapping, otherwise the band is gathered from
+    the strips or tiles once.  Resident memory therefore grows only with the
+    bands that are actually looked at.  Any other indexing, or passing the
+    raster to NumPy, reads the full (height, width, bands) stack.
+    """
+
+    def __init__(self, raw, tags):
+        self.raw = raw
+        self.height = tags[IMAGE_LENGTH][0]
+        self.width = tags[IMAGE_WIDTH][0]
+        self.band_count = tags.get(SAMPLES_PER_PIXEL, (1,))[0]
+        self.planar = tags.get(PLANAR_CONFIG, (1,))[0] == 2
+        bits = tags.get(BITS_PER_SAMPLE, (1,))[0]
+        kind = SAMPLE_KINDS[tags.get(SAMPLE_FORMAT, (1,))[0]]
+        self.file_dtype = np.dtype(tags['byteorder'] + kind + str(bits // 8))
+        self.dtype = self.file_dtype.newbyteorder('=')
+        self.shape = (self.height, self.width, self.band_count)
+        self.ndim = 3
+        self.tiled = TILE_OFFSETS in tags
+        if self.tiled:
+            self.block = (tags[TILE_LENGTH][0], tags[TILE_WIDTH][0])
+            self.offsets = tags[TILE_OFFSETS]
+        else:
+            self.block = (min(tags.get(ROWS_PER_STRIP, (self.height,))[0], self.height), self.width)
+            self.offsets = tags[STRIP_OFFSETS]
+        self._bands = {}
+
+    @property
+    def blocks_down(self):
+        return -(-self.height // self.block[0])
+
+    @property
+    def blocks_across(self):
+        return -(-self.width // self.block[1])
+
+    def __len__(self):
+        return self.height
+
+    def _samples(self, offset, count):
+        return self.raw[offset:offset + count * self.file_dtype.itemsize].view(self.file_dtype)
+
+    def _plane(self, band):
+        # Band-sequential strips laid out back to back: the band is one view
+        if self.tiled or not (self.planar or self.band_count == 1):
+            return None
+        per_band = self.blocks_down
+        first = self.offsets[band * per_band]
+        expected = first
+        for k in range(per_band):
+            if self.offsets[band * per_band + k] != expected:
+                return None
+            expected += min(self.block[0], self.height - k * self.block[0]) * self.width * self.file_dtype.itemsize
+        return self._samples(first, self.height * self.width).reshape(self.height, self.width)
+
+    def _gather(self, band):
+        out = np.empty((self.height, self.width), dtype=self.dtype)
+        rows, cols = self.block
+        samples = 1 if self.planar else self.band_count
+        per_band = self.blocks_down * self.blocks_across
+        for by in range(self.blocks_down):
+            for bx in range(self.blocks_across):
+                k = by * self.blocks_across + bx
+                if self.planar:
+                    k += band * per_band
+                y, x = by * rows, bx * cols
+                h, w = min(rows, self.height - y), min(cols, self.width - x)
+                if self.tiled:
+                    block = self._samples(self.offsets[k], rows * cols * samples).reshape(rows, cols, samples)
+                else:
+                    block = self._samples(self.offsets[k], h * cols * samples).reshape(h, cols, samples)
+                out[y:y + h, x:x + w] = block[:h, :w, 0 if self.planar else band]
+        return out
+
+    def band(self, band):
+        band = range(self.band_count)[band]
+        pixels = self._bands.get(band)
+        if pixels is None:
+            pixels = self._plane(band)
+            if pixels is None or pixels.dtype != self.dtype:
+                pixels = self._gather(band)
+            pixels.flags.writeable = False
+            self._bands[band] = pixels
+        return pixels
+
+    def __getitem__(self, key):
+        if (isinstance(key, tuple) and len(key) == 3 and isinstance(key[2], (int, np.integer))
+                and all(isinstance(k, slice) and k == slice(None) for k in key[:2])):
+            return self.band(key[2])
+        return np.asarray(self)[key]
+
+    def __array__(self, dtype=None, copy=None):
+        stack = np.dstack([self.band(b) for b in range(self.band_count)])
+        return stack if dtype is None else stack.astype(dtype)
+
+
+def _mappable(tags):
+    if tags is None or IMAGE_WIDTH not in tags or IMAGE_LENGTH not in tags:
+        return False
+    if tags.get(COMPRESSION, (1,))[0] != 1:
+        return False
+    if tags.get(PHOTOMETRIC, (1,))[0] not in (1, 2, 3):
+        return False
+    bits = set(tags.get(BITS_PER_SAMPLE, (1,)))
+    formats = set(tags.get(SAMPLE_FORMAT, (1,)))
+    if len(bits) != 1 or len(formats) != 1 or formats - set(SAMPLE_KINDS):
+        return False
+    bits = bits.pop()
+    if bits not in (8, 16, 32, 64) or (bits == 8 and formats == {3}):
+        return False
+    return TILE_OFFSETS in tags or STRIP_OFFSETS in tags
+
+
+def open_raster(path):
+    """Open an image for the editor, mapping uncompressed TIFFs lazily.
+
+    Uncompressed striped or tiled TIFFs are memory-mapped: multi-band files
+    come back as a LazyRaster, single-band files as a read-only 2-D array
+    over the mapping when the strips allow it.  Everything else (JPEG, PNG,
+    compressed TIFF, ...) is decoded by PIL as before.
+    """
+    raw = np.memmap(path, dtype=np.uint8, mode='r')
+    try:
+        tags = read_tiff_tags(raw)
+    except (struct.error, IndexError):
+        tags = None
+    if not _mappable(tags):
+        return np.array(Image.open(path))
+    raster = LazyRaster(raw, tags)
+    if raster.band_count == 1:
+        return raster.band(0)
+    return raster
@@ -0,0 +1,138 @@
+import threading
+from collections import deque
+
+import numpy as np
+
+from Tiled_Processing import MEMORY_BUDGET, TILE_EXECUTOR, WORKERS, allocate
+
+# Noise for the SAP() and GNoise() windows and for denoising fixtures made
+# in bulk by Batch_Processing.py.  Generators are numpy.random.Generator objects, so a
+# seed reproduces the same noise on any machine and in any process.
+
+
+def _limits(dtype):
+    # The values salt and pepper set: the full range of integer types, 0..1 otherwise
+    if dtype.kind in 'ui':
+        info = np.iinfo(dtype)
+        return info.max, info.min
+    return 1, 0
+
+
+class SaltAndPepper:
+    """Salt-and-pepper noise from one reusable, seedable generator.
+
+    Each call draws one float32 per pixel into a scratch buffer that is kept
+    for the next call of the same size, then sets the pixels whose draw is
+    below ``pepper`` to the minimum and those at or above ``1 - salt`` to
+    the maximum (salt wins where the two overlap).  All bands of a pixel
+    change together, as with a real stuck sensor element.
+    """
+
+    def __init__(self, seed=None):
+        self.rng = np.random.default_rng(seed)
+        self._uniform = None
+
+    def reseed(self, seed):
+        self.rng = np.random.default_rng(seed)
+
+    def __call__(self, image, salt, pepper, out=None):
+        image = np.asarray(image)
+        shape = image.shape[:2]
+        if self._uniform is None or self._uniform.shape != shape:
+            self._uniform = np.empty(shape, np.float32)
+        uniform = self.rng.random(out=self._uniform, dtype=np.float32)
+
+        if out is None:
+            out = np.empty_like(image)
+        np.copyto(out, image)
+        high, low = _limits(image.dtype)
+        out[uniform < pepper] = low
+        out[uniform >= 1 - salt] = high
+        return out
+
+
+def salt_and_pepper(image, salt, pepper, seed=None):
+    """One-off salt-and-pepper noise; ``seed`` makes it reproducible."""
+    return SaltAndPepper(seed)(image, salt, pepper)
+
+
+# Gaussian noise is generated in strips of about this many float32 samples,
+# each from its own child generator, so the result does not depend on how
+# many threads run the strips.
+STRIP_SAMPLES = 1 << 20
+
+_scratch = threading.local()
+
+
+def _strip_buffer(shape):
+    # float32 scratch of the calling worker thread, grown as needed and kept
+    size = int(np.prod(shape))
+    buffer = getattr(_scratch, 'buffer', None)
+    if buffer is None or buffer.size < size:
+        buffer = _scratch.buffer = np.empty(size, np.float32)
+    return buffer[:size].reshape(shape)
+
+
+def _noisy_strip(seed, image, out, rows, mean, sigma):
+    block = image[rows]
+    noise = _strip_buffer(block.shape)
+    np.random.default_rng(seed).standard_normal(out=noise, dtype=np.float32)
+    noise *= sigma
+    noise += mean
+    noise += block
+    if out.dtype.kind in 'ui':
+        info = np.iinfo(out.dtype)
+        np.clip(noise, info.min, info.max, out=noise)
+        np.rint(noise, out=noise)
+    np.copyto(out[rows], noise, casting='unsafe')
+
+
+class GaussianNoise:
+    """Additive Gaussian noise in float32, saturated back to the image type.
+
+    The image is processed in strips of rows on the tile pool.  Each strip
+    draws its samples into a float32 scratch buffer owned by the worker
+    thread and reused on every call, adds the image to it in place and
+    writes the clipped, rounded result into ``out``, so no full-size
+    temporary is made: 4 bytes per pixel and thread of scratch instead of
+    the 16 of a float64 normal() plus sum.  ``out`` can be reused across
+    slider ticks; if not given, it is allocated like Tiled_Processing's
+    outputs (on disk beyond ``budget``).  Integer images keep their dtype,
+    float images come back as float32.
+
+    Every call spawns one child seed per strip from the generator's
+    SeedSequence, so a seed reproduces the whole series of calls whatever
+    the number of workers.
+    """
+
+    def __init__(self, seed=None):
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+    def reseed(self, seed):
+        self.seed_sequence = np.random.SeedSequence(seed)
+
+    def __call__(self, image, mean, sigma, out=None, budget=MEMORY_BUDGET, workers=None):
+        if not hasattr(image, 'shape'):
+            image = np.asarray(image)
+        dtype = image.dtype if image.dtype.kind in 'ui' else np.dtype(np.float32)
+        if out is None:
+            out = allocate(image.shape, dtype, budget)
+        row_samples = int(np.prod(image.shape[1:]))
+        step = max(1, STRIP_SAMPLES // row_samples)
+        strips = [slice(y, min(y + step, image.shape[0])) for y in range(0, image.shape[0], step)]
+        seeds = self.seed_sequence.spawn(len(strips))
+
+        workers = workers or WORKERS
+        pending = deque()
+        for seed, rows in zip(seeds, strips):
+            if len(pending) >= workers:
+                pending.popleft().result()
+            pending.append(TILE_EXECUTOR.submit(_noisy_strip, seed, image, out, rows, mean, sigma))
+        while pending:
+            pending.popleft().result()
+        return out
+
+
+def gaussian_noise(image, mean, sigma, seed=None):
+    """One-off Gaussian noise; ``seed`` makes it reproducible."""
+    return GaussianNoise(seed)(image, mean, sigma)
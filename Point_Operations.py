@@ -0,0 +1,30 @@
+import numpy as np
+
+from Lazy_Import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+# Point operations map every pixel value through the same function, so for
+# 8-bit bands they can be precomputed once as a 256-entry lookup table and
+# applied to the whole band (or to all bands at once) in a single pass.
+
+LEVELS = np.arange(256, dtype=np.float32)
+
+
+def brightness_lut(offset):
+    # v + offset, saturated to the 0..255 display range
+    return np.clip(LEVELS + float(offset), 0, 255).astype(np.uint8)
+
+
+def threshold_lut(threshold, max_value=255):
+    # max_value where v > threshold, 0 elsewhere (same rule as the old loops)
+    return np.where(LEVELS > float(threshold), max_value, 0).astype(np.uint8)
+
+
+def apply_lut(img, lut):
+    """Apply a 256-entry table to a single band or to a multi-band image."""
+    img = np.asarray(img)
+    if img.dtype == np.uint8:
+        return cv2.LUT(img, lut)
+    # Wider bands (e.g. 16-bit TIFF) saturate at 255 before the lookup
+    return np.take(lut, np.clip(img, 0, 255).astype(np.intp))
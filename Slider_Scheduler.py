@@ -0,0 +1,49 @@
+import time
+import tkinter as tk
+
+
+class SliderScheduler:
+    """Latest-wins wrapper for matplotlib Slider.on_changed callbacks.
+
+    A drag fires on_changed for every intermediate value.  Instead of
+    running the callback each time, the newest value is remembered and a
+    single run is scheduled on the Tk event loop; values that arrive before
+    it runs simply replace the pending one.  Runs are spaced at least
+    1/fps seconds apart and the last value of a drag is always rendered.
+    One scheduler can be shared by several sliders driving the same callback.
+    """
+
+    def __init__(self, widget, callback, fps=30):
+        self.widget = widget
+        self.callback = callback
+        self.interval = 1.0 / fps
+        self._pending = None
+        self._after_id = None
+        self._last_run = 0.0
+
+    def __call__(self, *args):
+        self._pending = args
+        if self._after_id is None:
+            wait = self.interval - (time.monotonic() - self._last_run)
+            try:
+                self._after_id = self.widget.after(max(0, int(wait * 1000)), self._run)
+            except tk.TclError:
+                # The window was closed while the slider was still moving
+                self._pending = None
+
+    def _run(self):
+        self._after_id = None
+        args, self._pending = self._pending, None
+        if args is None:
+            return
+        self._last_run = time.monotonic()
+        self.callback(*args)
+
+    def cancel(self):
+        if self._after_id is not None:
+            try:
+                self.widget.after_cancel(self._after_id)
+            except tk.TclError:
+                pass
+        self._after_id = None
+        self._pending = None
@@ -0,0 +1,111 @@
+"""Startup-time budget for App.py.
+
+Launches App.py a few times with ``python -X importtime`` and the
+STARTUP_BENCHMARK environment variable set, which makes the app close
+itself as soon as its first window is drawn.  Reports
+
+  * time to first window (median over the runs), and
+  * import cost per top-level package (median of the summed self times),
+
+and exits non-zero when the startup is over budget or when one of the
+modules that should load lazily (OpenCV, Matplotlib, ...) was imported
+before the first window, e.g.
+
+    python Startup_Benchmark.py --runs 5 --budget 1.5
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+APP = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'App.py')
+
+# Needed only by the analysis windows; App.py binds them with lazy_module()
+LAZY_MODULES = ('cv2', 'matplotlib', 'scipy', 'skimage')
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Measure the startup time of App.py.")
+    parser.add_argument('--runs', type=int, default=5, help="launches to take the median over")
+    parser.add_argument('--budget', type=float, default=2.0,
+                        help="maximum time to first window in seconds")
+    parser.add_argument('--import-budget', type=float,
+                        help="maximum total import time in seconds (default: no limit)")
+    parser.add_argument('--lazy', default=','.join(LAZY_MODULES),
+                        help="comma-separated packages that must not load at startup ('' to skip)")
+    parser.add_argument('--top', type=int, default=15, help="packages listed in the import report")
+    parser.add_argument('--timeout', type=float, default=60, help="seconds before a launch is abandoned")
+    return parser
+
+
+def parse_importtime(stderr):
+    """Self import time in seconds per top-level package from -X importtime."""
+    costs = defaultdict(float)
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        package = fields[2].strip().split('.')[0]
+        costs[package] += int(fields[0]) / 1e6
+    return costs
+
+
+def launch(timeout):
+    env = dict(os.environ, STARTUP_BENCHMARK='1')
+    start = time.time()
+    proc = subprocess.run([sys.executable, '-X', 'importtime', APP], cwd=os.path.dirname(APP), env=env,
+                          capture_output=True, text=True, timeout=timeout)
+    for line in proc.stdout.splitlines():
+        if line.startswith('first-window '):
+            return float(line.split()[1]) - start, parse_importtime(proc.stderr)
+    raise RuntimeError("App.py exited ({}) without drawing a window:\n{}".format(
+        proc.returncode, proc.stderr[-2000:]))
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    lazy = [name for name in args.lazy.split(',') if name]
+
+    first_window = []
+    imports = defaultdict(list)
+    for run in range(args.runs):
+        seconds, costs = launch(args.timeout)
+        first_window.append(seconds)
+        for package, cost in costs.items():
+            imports[package].append(cost)
+        print("run {}: first window after {:.3f} s".format(run + 1, seconds))
+
+    # A package missing from a run cost nothing in it
+    medians = {package: statistics.median(costs + [0.0] * (args.runs - len(costs)))
+               for package, costs in imports.items()}
+    total = sum(medians.values())
+    print()
+    print("import cost per package (median self time):")
+    for package, cost in sorted(medians.items(), key=lambda item: -item[1])[:args.top]:
+        print("{:9.1f} ms  {:5.1f} %  {}".format(cost * 1e3, 100 * cost / total if total else 0, package))
+    print("{:9.1f} ms  total".format(total * 1e3))
+
+    ttfw = statistics.median(first_window)
+    print()
+    print("time to first window: {:.3f} s (median of {}, budget {:.3f} s)".format(ttfw, args.runs, args.budget))
+
+    failures = []
+    if ttfw > args.budget:
+        failures.append("time to first window {:.3f} s exceeds {:.3f} s".format(ttfw, args.budget))
+    if args.import_budget is not None and total > args.import_budget:
+        failures.append("import time {:.3f} s exceeds {:.3f} s".format(total, args.import_budget))
+    for name in lazy:
+        if name in imports:
+            failures.append("{} is imported at startup".format(name))
+    for failure in failures:
+        print("FAILED  " + failure)
+    return 1 if failures else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,338 @@
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from Lazy_Import import lazy_module
+from Tiled_Processing import MEMORY_BUDGET, adaptive_threshold_tiled, gaussian_blur_tiled, run_tiled
+
+cv2 = lazy_module('cv2')
+
+# Blurred bands kept per image, as in Unsharp_Masking: one full-size plane
+# per block size, so only the last few sizes are kept.
+BLUR_CACHE = 2
+
+# Names of the cv2.ADAPTIVE_THRESH_* constants, looked up when used
+ADAPTIVE_METHODS = {
+    'mean': 'ADAPTIVE_THRESH_MEAN_C',
+    'gaussian': 'ADAPTIVE_THRESH_GAUSSIAN_C',
+}
+
+
+def otsu_threshold(hist):
+    """Otsu's threshold of a 256-bin histogram, as cv2.THRESH_OTSU picks it.
+
+    One pass over the bins with cv2's own float64 recurrences, so ties and
+    rounding resolve to the same level.
+    """
+    hist = np.asarray(hist, np.float64).ravel()
+    scale = 1.0 / hist.sum()
+    mu = float(np.dot(np.arange(hist.size), hist)) * scale
+    eps = np.finfo(np.float32).eps
+    q1 = mu1 = max_sigma = 0.0
+    level = 0
+    for i, count in enumerate(hist.tolist()):
+        p_i = count * scale
+        mu1 *= q1
+        q1 += p_i
+        q2 = 1.0 - q1
+        if min(q1, q2) < eps or max(q1, q2) > 1.0 - eps:
+            continue
+        mu1 = (mu1 + i * p_i) / q1
+        mu2 = (mu - q1 * mu1) / q2
+        sigma = q1 * q2 * (mu1 - mu2) * (mu1 - mu2)
+        if sigma > max_sigma:
+            max_sigma = sigma
+            level = i
+    return level
+
+
+def multi_otsu_thresholds(hist, classes):
+    """The ``classes - 1`` levels that split a histogram into Otsu classes.
+
+    Maximizes the between-class variance, i.e. the sum over classes of
+    (sum of values)**2 / count, by dynamic programming over the bins:
+    O(classes * bins**2) on the histogram instead of a search over the
+    image.  Class c holds the levels above threshold c - 1 up to and
+    including threshold c, as with the single-level cv2 rule ``v > t``.
+    """
+    hist = np.asarray(hist, np.float64).ravel()
+    bins = hist.size
+    if not 2 <= classes <= bins:
+        raise ValueError("classes must be between 2 and {}".format(bins))
+    counts = np.concatenate(([0.0], np.cumsum(hist)))
+    sums = np.concatenate(([0.0], np.cumsum(hist * np.arange(bins))))
+    # score[i, j]: the class of levels i..j-1, empty ones (count 0) scoring 0
+    count = counts[None, :] - counts[:, None]
+    total = sums[None, :] - sums[:, None]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        score = np.where(count > 0, total * total / count, 0.0)
+    score[np.tril_indices(bins + 1)] = -np.inf
+
+    # best[j]: best split of levels 0..j-1 into the classes placed so far
+    best = score[0].copy()
+    starts = []
+    for _ in range(classes - 1):
+        candidates = best[:, None] + score
+        starts.append(np.argmax(candidates, axis=0))
+        best = candidates.max(axis=0)
+
+    thresholds = []
+    end = bins
+    for start in reversed(starts):
+        end = int(start[end])
+        thresholds.append(end - 1)
+    return thresholds[::-1]
+
+
+class Otsu:
+    """Gaussian blur + Otsu thresholding of one band, kept between calls.
+
+    The blurred band, its 256-bin histogram and the Otsu level depend only
+    on the blur size, so they are made once per size (the last
+    ``cache_size`` sizes are kept) and a slider move is a single
+    cv2.threshold pass at the known level.  Gives the same image as
+    cv2.threshold(blur, low, high, THRESH_BINARY + THRESH_OTSU); ``low`` is
+    ignored there too.  Safe to call from several BackgroundJob workers.
+
+    With ``classes`` above 2 the same histogram is split by
+    multi_otsu_thresholds() and the band labelled through a 256-entry
+    table, class c shown as c / (classes - 1) of ``high``; neither step
+    depends on the image size beyond one cv2.LUT pass.
+    """
+
+    def __init__(self, image, cache_size=BLUR_CACHE):
+        self.image = image
+        self.cache_size = cache_size
+        self._blurs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def blur(self, size):
+        """(blurred band, histogram, Otsu level) for a size x size Gaussian blur.
+
+        The histogram is None for bands other than 8-bit.
+        """
+        size = int(size)
+        with self._lock:
+            entry = self._blurs.get(size)
+            if entry is not None:
+                self._blurs.move_to_end(size)
+                return entry
+            blurred = gaussian_blur_tiled(self.image, (size, size), 0)
+            if blurred.dtype == np.uint8:
+                hist = cv2.calcHist([blurred], [0], None, [256], [0, 256]).ravel()
+                level = otsu_threshold(hist)
+            else:
+                # Only 8-bit bands have a 256-bin histogram; let cv2 take the rest
+                hist = None
+                level = cv2.threshold(blurred, 0, 1, cv2.THRESH_BINARY + cv2.THRESH_OTSU)[0]
+            entry = self._blurs[size] = (blurred, hist, level)
+            while len(self._blurs) > self.cache_size:
+                self._blurs.popitem(last=False)
+            return entry
+
+    def threshold(self, size):
+        return self.blur(size)[2]
+
+    def thresholds(self, size, classes):
+        """The multi-level Otsu thresholds of the blurred 8-bit band."""
+        hist = self.blur(size)[1]
+        if hist is None:
+            raise ValueError("multi-level Otsu needs an 8-bit band")
+        return multi_otsu_thresholds(hist, classes)
+
+    def __call__(self, size, low, high, classes=2):
+        blurred, hist, level = self.blur(size)
+        if classes <= 2:
+            return cv2.threshold(blurred, level, high, cv2.THRESH_BINARY)[1]
+        labels = np.digitize(np.arange(256), self.thresholds(size, classes), right=True)
+        lut = np.rint(labels * (np.clip(high, 0, 255) / (classes - 1))).astype(np.uint8)
+        return cv2.LUT(blurred, lut)
+
+
+def _offsets(block, method, size):
+    # block - local mean, with the mean rounded to uint8 as cv2.adaptiveThreshold does
+    border = cv2.BORDER_REPLICATE | cv2.BORDER_ISOLATED
+    if method == 'mean':
+        mean = cv2.boxFilter(block, cv2.CV_8U, (size, size), normalize=True, borderType=border)
+    else:
+        # Blurred in float and then rounded, which is what cv2.adaptiveThreshold
+        # stores; the 8-bit GaussianBlur path takes fixed-point shortcuts
+        mean = cv2.GaussianBlur(block.astype(np.float32), (size, size), 0, 0, borderType=border)
+        mean = np.rint(mean, out=mean).astype(np.uint8)
+    return cv2.subtract(block, mean, dtype=cv2.CV_16S)
+
+
+class AdaptiveThreshold:
+    """cv2.adaptiveThreshold (THRESH_BINARY) of one band, split into its two halves.
+
+    The local mean is all that depends on the block size, so the signed
+    difference band - mean is kept as int16 per block size and a
+    change of the constant or the maximum value is one cv2.compare pass.
+    The mean is a normalized box filter, whose running row and column sums
+    cost the same at any block size, or a Gaussian blur; both are rounded
+    to uint8 first, so the output is the same array cv2.adaptiveThreshold
+    gives.  Bands other than 8-bit go to cv2 as before.
+    """
+
+    def __init__(self, image, method, cache_size=BLUR_CACHE, budget=MEMORY_BUDGET):
+        self.image = image
+        self.method = method
+        self.cache_size = cache_size
+        self.budget = budget
+        self._offsets = OrderedDict()
+        self._lock = threading.Lock()
+
+    def offsets(self, size):
+        """int16 band - local mean for a size x size block."""
+        size = int(size)
+        with self._lock:
+            offsets = self._offsets.get(size)
+            if offsets is not None:
+                self._offsets.move_to_end(size)
+                return offsets
+            offsets = run_tiled(_offsets, self.image, size // 2, self.method, size, dtype=np.int16,
+                                budget=self.budget)
+            self._offsets[size] = offsets
+            while len(self._offsets) > self.cache_size:
+                self._offsets.popitem(last=False)
+            return offsets
+
+    def __call__(self, size, constant, max_value=255):
+        if self.image.dtype != np.uint8:
+            return adaptive_threshold_tiled(self.image, max_value, getattr(cv2, ADAPTIVE_METHODS[self.method]),
+                                            cv2.THRESH_BINARY, int(size), constant, budget=self.budget)
+        # cv2 rounds the constant up and saturates the maximum to 8 bits
+        mask = cv2.compare(self.offsets(size), float(-np.ceil(constant)), cv2.CMP_GT)
+        max_value = int(np.clip(np.rint(max_value), 0, 255))
+        if max_value != 255:
+            np.minimum(mask, max_value, out=mask)
+        return mask
+
+
+# Sauvola and Niblack threshold every pixel against the mean and standard
+# deviation of the window around it: m + k * s (Niblack) or
+# m * (1 + k * (s / R - 1)) with R half the band's value range (Sauvola).
+LOCAL_METHODS = {
+    'sauvola': 0.2,
+    'niblack': -0.2,
+}
+
+# Side of the tiles the local statistics are computed in on the tile pool;
+# each tile also reads half a window of neighbours on every side.
+LOCAL_TILE = 512
+
+
+def _dynamic_range(dtype):
+    # Sauvola's R: half the value range of the band's type, 128 for 8-bit
+    if dtype.kind in 'ui':
+        info = np.iinfo(dtype)
+        return (int(info.max) - int(info.min) + 1) / 2
+    return 0.5
+
+
+def _local_statistics(block, window):
+    # Window mean and standard deviation from integral images of the values
+    # and their squares: four lookups per pixel whatever the window size
+    r = window // 2
+    padded = cv2.copyMakeBorder(block, r, r, r, r, cv2.BORDER_REPLICATE)
+    sums, squares = cv2.integral2(padded, sdepth=cv2.CV_64F, sqdepth=cv2.CV_64F)
+    height, width = block.shape[:2]
+
+    def window_sum(table):
+        total = table[window:window + height, window:window + width] - table[:height, window:window + width]
+        total -= table[window:window + height, :width]
+        total += table[:height, :width]
+        return total
+
+    count = window * window
+    mean = window_sum(sums) / count
+    variance = window_sum(squares) / count - mean * mean
+    np.maximum(variance, 0, out=variance)
+    return mean, np.sqrt(variance, out=variance)
+
+
+def _binarize(block, mean, std, method, k, dynamic_range, max_value):
+    if method == 'sauvola':
+        threshold = std / dynamic_range
+        threshold -= 1
+        threshold *= k
+        threshold += 1
+        threshold *= mean
+    else:
+        threshold = std * k
+        threshold += mean
+    return np.where(block > threshold, np.uint8(max_value), np.uint8(0))
+
+
+def _local_threshold(block, method, window, k, dynamic_range, max_value):
+    mean, std = _local_statistics(block, window)
+    return _binarize(block, mean, std, method, k, dynamic_range, max_value)
+
+
+def _statistics_planes(block, window):
+    return np.stack(_local_statistics(block, window), axis=-1).astype(np.float32)
+
+
+def _binarize_planes(block, statistics, method, k, dynamic_range, max_value):
+    return _binarize(block, statistics[..., 0], statistics[..., 1], method, k, dynamic_range, max_value)
+
+
+def _max_value(max_value):
+    return int(np.clip(np.rint(max_value), 0, 255))
+
+
+def local_threshold(image, method, window, k=None, max_value=255, budget=MEMORY_BUDGET, workers=None):
+    """Sauvola or Niblack binarization of one band in a single tiled pass.
+
+    Each tile computes its window statistics, thresholds itself and is
+    dropped, so a 600 dpi page costs a few tiles of float64 scratch per
+    worker rather than full-size planes.  The result is uint8,
+    ``max_value`` above the threshold and 0 elsewhere.
+    """
+    window = int(window)
+    k = LOCAL_METHODS[method] if k is None else k
+    return run_tiled(_local_threshold, image, window // 2, method, window, k,
+                     _dynamic_range(np.dtype(image.dtype)), _max_value(max_value), dtype=np.uint8,
+                     budget=budget, workers=workers, tile=max(LOCAL_TILE, 4 * (window // 2)))
+
+
+class LocalThreshold:
+    """Sauvola or Niblack thresholding of one band with the window statistics kept.
+
+    Mean and standard deviation depend only on the window size, so they
+    are kept as float32 per size (the last ``cache_size`` sizes) and a
+    change of k or of the maximum value is one tiled comparison.  Both
+    passes run tile by tile on the tile pool.
+    """
+
+    def __init__(self, image, method, cache_size=BLUR_CACHE, budget=MEMORY_BUDGET):
+        self.image = image
+        self.method = method
+        self.dynamic_range = _dynamic_range(np.dtype(image.dtype))
+        self.cache_size = cache_size
+        self.budget = budget
+        self._statistics = OrderedDict()
+        self._lock = threading.Lock()
+
+    def statistics(self, window):
+        """float32 (mean, standard deviation) planes, stacked on the last axis."""
+        window = int(window)
+        with self._lock:
+            statistics = self._statistics.get(window)
+            if statistics is not None:
+                self._statistics.move_to_end(window)
+                return statistics
+            statistics = run_tiled(_statistics_planes, self.image, window // 2, window, dtype=np.float32,
+                                   shape=tuple(self.image.shape[:2]) + (2,), budget=self.budget,
+                                   tile=max(LOCAL_TILE, 4 * (window // 2)))
+            self._statistics[window] = statistics
+            while len(self._statistics) > self.cache_size:
+                self._statistics.popitem(last=False)
+            return statistics
+
+    def __call__(self, window, k=None, max_value=255):
+        k = LOCAL_METHODS[self.method] if k is None else k
+        return run_tiled(_binarize_planes, (self.image, self.statistics(window)), 0, self.method, k,
+                         self.dynamic_range, _max_value(max_value), dtype=np.uint8,
+                         shape=self.image.shape[:2], budget=self.budget, tile=LOCAL_TILE * 2)
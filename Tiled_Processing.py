@@ -0,0 +1,284 @@
+import math
+import os
+import tempfile
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from Lazy_Import import lazy_module
+
+cv2 = lazy_module('cv2')
+
+# Peak working set of one tiled operation (all tiles in flight, their
+# inputs, outputs and OpenCV scratch).  Images that fit are processed whole.
+MEMORY_BUDGET = 256 * 1024 * 1024
+
+# Scratch bytes per pixel and channel that OpenCV may allocate inside a tile
+# (one float64 plane covers filter2D, GaussianBlur and adaptiveThreshold).
+WORK_BYTES = 8
+
+MIN_TILE = 64
+
+WORKERS = os.cpu_count() or 1
+
+# Separate from Compute_Pool.EXECUTOR: the window jobs running there wait on
+# these tiles, and sharing one pool could starve it.
+TILE_EXECUTOR = ThreadPoolExecutor(max_workers=WORKERS)
+
+
+def allocate(shape, dtype, budget=MEMORY_BUDGET):
+    """An output array, backed by an anonymous temporary file if it is over budget."""
+    dtype = np.dtype(dtype)
+    if int(np.prod(shape)) * dtype.itemsize <= budget:
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(tempfile.TemporaryFile(), dtype=dtype, mode='w+', shape=tuple(shape))
+
+
+def tile_size(shape, halo, bytes_per_pixel, budget=MEMORY_BUDGET, workers=1):
+    # Largest square tile whose haloed block fits the budget share of one worker
+    side = math.isqrt(max(1, budget // (workers * bytes_per_pixel))) - 2 * halo
+    return max(MIN_TILE, min(side, max(shape[0], shape[1])))
+
+
+def tiles(shape, tile, halo):
+    """Yield (source, crop, target) slices covering an image of ``shape``.
+
+    ``source`` is the tile grown by ``halo`` on every side (clipped at the
+    image border), ``crop`` selects the tile back out of the processed
+    source block, and ``target`` is where it goes in the output.
+    """
+    height, width = shape[:2]
+    for y in range(0, height, tile):
+        for x in range(0, width, tile):
+            y0, x0 = max(0, y - halo), max(0, x - halo)
+            y1, x1 = min(height, y + tile + halo), min(width, x + tile + halo)
+            th, tw = min(tile, height - y), min(tile, width - x)
+            yield ((slice(y0, y1), slice(x0, x1)),
+                   (slice(y - y0, y - y0 + th), slice(x - x0, x - x0 + tw)),
+                   (slice(y, y + th), slice(x, x + tw)))
+
+
+def _run_tile(func, images, out, source, crop, target, args, kwargs):
+    blocks = [np.ascontiguousarray(image[source]) for image in images]
+    out[target] = func(*blocks, *args, **kwargs)[crop]
+
+
+def _bytes_per_pixel(images, dtype, shape):
+    # Inputs, OpenCV scratch and output of one pixel while its tile is in flight
+    total = int(np.prod(shape[2:], dtype=np.int64)) * dtype.itemsize
+    for source in images:
+        channels = source.shape[2] if len(source.shape) > 2 else 1
+        total += channels * (source.dtype.itemsize + WORK_BYTES)
+    return total
+
+
+def run_tiled(func, image, halo, *args, out=None, dtype=None, shape=None, budget=MEMORY_BUDGET,
+              workers=None, tile=None, **kwargs):
+    """Apply ``func(block, *args, **kwargs)`` to ``image`` tile by tile.
+
+    ``func`` must be a neighbourhood operation that keeps the block's shape
+    and reaches at most ``halo`` pixels from the output pixel.  Every tile is
+    processed with a ``halo``-wide border of real neighbours and cropped back,
+    so the stitched result equals the untiled one; at the image border the
+    operation sees the same edge it would see on the whole image.
+
+    ``image`` may be any array that can be sliced, e.g. an np.memmap, and is
+    only read one tile at a time.  At most ``workers`` tiles are in flight and
+    their size is chosen so that, together, they stay within ``budget``
+    bytes.  The result is written to ``out`` (allocated if not given, on disk
+    when it is itself larger than the budget) and returned.  ``shape`` is the
+    result's shape when it differs from the image's, e.g. several planes per
+    pixel as trailing axes; it sizes the tiles and the allocated output.
+
+    ``image`` may also be a tuple of equally sized arrays (say dx and dy);
+    ``func`` then gets one block of each, in that order, before ``args``.
+
+    ``tile`` caps the tile side and splits even an image that fits the
+    budget, to spread an operation that is costly per pixel over the workers.
+    """
+    images = image if isinstance(image, tuple) else (image,)
+    image = images[0]
+    dtype = np.dtype(dtype or image.dtype)
+    shape = tuple(shape or image.shape)
+    bytes_per_pixel = _bytes_per_pixel(images, dtype, shape)
+
+    if tile is None and int(np.prod(image.shape[:2])) * bytes_per_pixel <= budget:
+        # Small enough to do in one go, exactly as before
+        result = func(*[np.asarray(source) for source in images], *args, **kwargs)
+        if out is None:
+            return result
+        out[...] = result
+        return out
+
+    if out is None:
+        out = allocate(shape, dtype, budget)
+    workers = workers or WORKERS
+    tile = min(tile or math.inf, tile_size(image.shape, halo, bytes_per_pixel, budget, workers))
+
+    pending = deque()
+    for source, crop, target in tiles(image.shape, tile, halo):
+        if len(pending) >= workers:
+            pending.popleft().result()
+        pending.append(TILE_EXECUTOR.submit(_run_tile, func, images, out, source, crop, target,
+                                            args, kwargs))
+    while pending:
+        pending.popleft().result()
+    return out
+
+
+def _gaussian_halo(ksize, sigma, depth):
+    # Mirrors OpenCV's kernel size rule when ksize is 0
+    if ksize > 0:
+        return ksize // 2
+    size = int(round(sigma * (3 if depth == np.uint8 else 4) * 2 + 1)) | 1
+    return size // 2
+
+
+# Drop-in tiled versions of the neighbourhood operations used by the app;
+# the arguments are those of the cv2 functions they wrap.
+
+def filter2d_tiled(src, ddepth, kernel, budget=MEMORY_BUDGET):
+    kernel = np.asarray(kernel)
+    halo = max(kernel.shape) // 2
+    return run_tiled(cv2.filter2D, src, halo, ddepth, kernel, budget=budget)
+
+
+def gaussian_blur_tiled(src, ksize, sigmaX, sigmaY=0, budget=MEMORY_BUDGET):
+    halo = max(_gaussian_halo(ksize[0], sigmaX, src.dtype),
+               _gaussian_halo(ksize[1], sigmaY or sigmaX, src.dtype))
+    return run_tiled(cv2.GaussianBlur, src, halo, tuple(ksize), sigmaX, sigmaY=sigmaY, budget=budget)
+
+
+# Canny codes of _canny_classes: no edge, candidate (a local maximum above the
+# low threshold) and seed (a candidate above the high threshold as well)
+WEAK, STRONG = 1, 2
+
+
+def _canny_classes(*blocks, low, high, aperture):
+    # Non-maximum suppression by cv2.Canny itself: with both thresholds at
+    # ``low`` every candidate is its own seed, so the output is the candidates
+    if len(blocks) == 1:
+        border = cv2.BORDER_REPLICATE
+        blocks = (cv2.Sobel(blocks[0], cv2.CV_16S, 1, 0, ksize=aperture, borderType=border),
+                  cv2.Sobel(blocks[0], cv2.CV_16S, 0, 1, ksize=aperture, borderType=border))
+    dx, dy = blocks
+    classes = cv2.Canny(dx, dy, low, low)
+    magnitude = np.abs(dx.astype(np.int32)) + np.abs(dy.astype(np.int32))
+    np.minimum(classes, WEAK, out=classes)
+    classes[(magnitude > int(np.floor(high))) & (classes > 0)] = STRONG
+    return classes
+
+
+def _seam_pairs(first, second):
+    # Foreground ids on either side of a seam that touch (8-connectivity)
+    length = first.shape[0]
+    pairs = []
+    for shift in (-1, 0, 1):
+        a = first[max(0, -shift):length - max(0, shift)]
+        b = second[max(0, shift):length - max(0, -shift)]
+        touching = (a > 0) & (b > 0)
+        pairs.append(np.stack([a[touching], b[touching]], axis=1))
+    return np.concatenate(pairs)
+
+
+def _hysteresis(classes, budget, tile=None):
+    """255 on every candidate connected to a seed, however far away it is.
+
+    Components are labelled tile by tile and their ids joined across the
+    tile seams with a union-find, so memory stays within ``budget`` and the
+    result equals one global labelling of the candidates.
+    """
+    height, width = classes.shape
+    tile = min(tile or math.inf, tile_size(classes.shape, 0, 2 + 4 + WORK_BYTES, budget))
+    starts_y, starts_x = range(0, height, tile), range(0, width, tile)
+    seam_rows = {y: np.zeros(width, np.int64) for s in starts_y[1:] for y in (s - 1, s)}
+    seam_cols = {x: np.zeros(height, np.int64) for s in starts_x[1:] for x in (s - 1, s)}
+
+    def labelled(window):
+        return cv2.connectedComponents((classes[window] > 0).view(np.uint8), connectivity=8,
+                                       ltype=cv2.CV_32S)
+
+    # Pass 1: label each tile, note which ids hold a seed and what lies on the seams
+    bases, seeded = {}, [np.zeros(1, bool)]
+    base = 0
+    for y in starts_y:
+        for x in starts_x:
+            window = (slice(y, y + tile), slice(x, x + tile))
+            count, labels = labelled(window)
+            bases[y, x] = base
+            seeds = np.zeros(count, bool)
+            seeds[labels[classes[window] == STRONG]] = True
+            seeded.append(seeds[1:])
+            for row in seam_rows:
+                if y <= row < y + tile:
+                    seam_rows[row][x:x + tile] = np.where(labels[row - y] > 0, labels[row - y] + base, 0)
+            for col in seam_cols:
+                if x <= col < x + tile:
+                    seam_cols[col][y:y + tile] = np.where(labels[:, col - x] > 0, labels[:, col - x] + base, 0)
+            base += count - 1
+    seeded = np.concatenate(seeded)
+
+    # Join the ids that touch across a seam; a component is kept if any part has a seed
+    pairs = [_seam_pairs(seam_rows[s - 1], seam_rows[s]) for s in starts_y[1:]]
+    pairs += [_seam_pairs(seam_cols[s - 1], seam_cols[s]) for s in starts_x[1:]]
+    if pairs:
+        pairs = np.unique(np.concatenate(pairs), axis=0)
+        nodes, edges = np.unique(pairs, return_inverse=True)
+        parent = list(range(len(nodes)))
+
+        def find(node):
+            while parent[node] != node:
+                parent[node] = parent[parent[node]]
+                node = parent[node]
+            return node
+
+        for a, b in edges.reshape(-1, 2).tolist():
+            a, b = find(a), find(b)
+            if a != b:
+                parent[max(a, b)] = min(a, b)
+        roots = np.array([find(node) for node in range(len(nodes))])
+        root_seeded = np.zeros(len(nodes), bool)
+        np.logical_or.at(root_seeded, roots, seeded[nodes])
+        seeded[nodes] = root_seeded[roots]
+
+    # Pass 2: label the tiles again (same ids) and paint the kept components
+    out = allocate(classes.shape, np.uint8, budget)
+    for (y, x), base in bases.items():
+        window = (slice(y, y + tile), slice(x, x + tile))
+        count, labels = labelled(window)
+        lut = np.where(seeded[base:base + count], 255, 0).astype(np.uint8)
+        lut[0] = 0
+        out[window] = lut[labels]
+    return out
+
+
+def canny_tiled(image, threshold1, threshold2, budget=MEMORY_BUDGET, aperture=3, tile=None):
+    """cv2.Canny(image, threshold1, threshold2) of any size, within ``budget``.
+
+    ``image`` may also be an int16 (dx, dy) pair, as cv2.Canny takes it.
+    Inputs already in RAM, or small enough to fit the budget, go to
+    cv2.Canny whole: tiling them would only add work.  Memory-mapped ones
+    get their non-maximum suppression tile by tile and one hysteresis pass
+    over the whole candidate map, so an edge is kept exactly when
+    cv2.Canny would keep it, even with its seed many tiles away.  ``tile``
+    forces that path with at most that tile side, as in run_tiled.
+    """
+    images = image if isinstance(image, tuple) else (image,)
+    bytes_per_pixel = _bytes_per_pixel(images, np.dtype(np.int32), images[0].shape[:2])
+    resident = not any(isinstance(source, np.memmap) for source in images)
+    fits = int(np.prod(images[0].shape[:2])) * bytes_per_pixel <= budget
+    if tile is None and (resident or fits):
+        return cv2.Canny(*[np.asarray(source) for source in images], threshold1, threshold2)
+
+    low, high = sorted((threshold1, threshold2))
+    halo = 1 if len(images) == 2 else aperture // 2 + 1
+    classes = run_tiled(_canny_classes, image, halo, low=low, high=high, aperture=aperture,
+                        dtype=np.uint8, shape=images[0].shape[:2], budget=budget, tile=tile)
+    return _hysteresis(classes, budget, tile)
+
+
+def adaptive_threshold_tiled(src, maxValue, adaptiveMethod, thresholdType, blockSize, C,
+                             budget=MEMORY_BUDGET):
+    return run_tiled(cv2.adaptiveThreshold, src, blockSize // 2, maxValue, adaptiveMethod,
+                     thresholdType, blockSize, C, dtype=np.uint8, budget=budget)
@@ -0,0 +1,46 @@
+import threading
+from collections import OrderedDict
+
+from Lazy_Import import lazy_module
+from Tiled_Processing import gaussian_blur_tiled
+
+cv2 = lazy_module('cv2')
+
+# Blurred bases kept per image; one full-size plane each, so only the last
+# few (size, sigma X, sigma Y) settings are worth keeping.
+BLUR_CACHE = 2
+
+
+class UnsharpMask:
+    """Unsharp masking of one image with the blurred base kept between calls.
+
+    img + K * (img - blur) is computed as (1 + K) * img - K * blur in a
+    single cv2.addWeighted pass, which rounds and saturates to the image's
+    own type instead of wrapping around like uint8 arithmetic.  The blur is
+    cached per (size, sigma_x, sigma_y), so changing only the amount K
+    costs one blend and no filtering.  Safe to call from several
+    BackgroundJob workers at once.
+    """
+
+    def __init__(self, image, cache_size=BLUR_CACHE):
+        self.image = image
+        self.cache_size = cache_size
+        self._blurs = OrderedDict()
+        self._lock = threading.Lock()
+
+    def blur(self, size, sigma_x, sigma_y):
+        key = (int(size), float(sigma_x), float(sigma_y))
+        with self._lock:
+            blurred = self._blurs.get(key)
+            if blurred is not None:
+                self._blurs.move_to_end(key)
+                return blurred
+            blurred = gaussian_blur_tiled(self.image, (key[0], key[0]), key[1], key[2])
+            self._blurs[key] = blurred
+            while len(self._blurs) > self.cache_size:
+                self._blurs.popitem(last=False)
+            return blurred
+
+    def __call__(self, size, sigma_x, sigma_y, amount):
+        blurred = self.blur(size, sigma_x, sigma_y)
+        return cv2.addWeighted(self.image, 1 + amount, blurred, -amount, 0)
@@ -0,0 +1,36 @@
+import cv2
+import numpy as np
+import pytest
+
+from Batch_Processing import process_file
+from Noise_Generation import gaussian_noise, salt_and_pepper
+
+# A pixel whose red and blue differ, so a channel swap cannot go unnoticed
+RGB = (200, 50, 10)
+
+
+def _colour_image(path, channels):
+    rgb = np.zeros((8, 8, channels), np.uint8)
+    rgb[..., :3] = RGB
+    if channels == 4:
+        rgb[..., 3] = 255
+    # cv2 writes BGR(A); the file then holds RGB order for every other reader
+    cv2.imwrite(str(path), cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR if channels == 3 else cv2.COLOR_RGBA2BGRA))
+    return rgb
+
+
+@pytest.mark.parametrize('channels', [3, 4])
+@pytest.mark.parametrize('func, params, whole', [
+    (np.copy, (), False),
+    (salt_and_pepper, (0, 0, 1), True),
+    (gaussian_noise, (0, 0, 1), True),
+])
+def test_colour_round_trip(tmp_path, channels, func, params, whole):
+    source, target = tmp_path / 'in.png', tmp_path / 'out' / 'in.png'
+    rgb = _colour_image(source, channels)
+    process_file(str(source), str(target), func, params, None, whole=whole)
+
+    written = cv2.imread(str(target), cv2.IMREAD_UNCHANGED)
+    assert written.shape == rgb.shape
+    assert tuple(written[0, 0, :3]) == RGB[::-1]  # BGR on disk
+    assert np.array_equal(written, cv2.cvtColor(rgb, cv2.COLOR_RGB2BGR if channels == 3 else cv2.COLOR_RGBA2BGRA))
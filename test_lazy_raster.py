@@ -0,0 +1,101 @@
+import struct
+
+import numpy as np
+import pytest
+
+pytest.importorskip('PIL')
+
+from PIL import Image  # noqa: E402
+
+from Lazy_Raster import LazyRaster, open_raster  # noqa: E402
+
+
+def _blocks(pixels, block):
+    # Strip or tile payloads in file order, edge tiles padded to full size
+    rows, cols = block
+    height, width = pixels.shape[:2]
+    for y in range(0, height, rows):
+        for x in range(0, width, cols):
+            chunk = pixels[y:y + rows, x:x + cols]
+            if cols < width:
+                padded = np.zeros((rows, cols) + pixels.shape[2:], pixels.dtype)
+                padded[:chunk.shape[0], :chunk.shape[1]] = chunk
+                chunk = padded
+            yield np.ascontiguousarray(chunk).astype(pixels.dtype.newbyteorder('<')).tobytes()
+
+
+def _write_tiff(path, pixels, rows=None, tile=None):
+    """Uncompressed little-endian TIFF, in strips of ``rows`` or square tiles."""
+    height, width = pixels.shape[:2]
+    samples = 1 if pixels.ndim == 2 else pixels.shape[2]
+    block = (tile, tile) if tile else (rows or height, width)
+    payloads = list(_blocks(pixels, block))
+    offsets, data = [], b''
+    for payload in payloads:
+        offsets.append(8 + len(data))
+        data += payload
+    tags = {
+        256: (4, [width]),
+        257: (4, [height]),
+        258: (3, [pixels.dtype.itemsize * 8] * samples),
+        259: (3, [1]),
+        262: (3, [2 if samples == 3 else 1]),
+        277: (3, [samples]),
+        284: (3, [1]),
+        339: (3, [{'u': 1, 'i': 2, 'f': 3}[pixels.dtype.kind]] * samples),
+    }
+    if tile:
+        tags.update({322: (4, [tile]), 323: (4, [tile]), 324: (4, offsets),
+                     325: (4, [len(p) for p in payloads])})
+    else:
+        tags.update({273: (4, offsets), 278: (4, [block[0]]), 279: (4, [len(p) for p in payloads])})
+
+    ifd = 8 + len(data)
+    extra = ifd + 2 + 12 * len(tags) + 4
+    entries, spill = b'', b''
+    for tag in sorted(tags):
+        kind, values = tags[tag]
+        packed = struct.pack('<' + ('H' if kind == 3 else 'I') * len(values), *values)
+        if len(packed) <= 4:
+            value = packed.ljust(4, b'\0')
+        else:
+            value = struct.pack('<I', extra + len(spill))
+            spill += packed
+        entries += struct.pack('<HHI', tag, kind, len(values)) + value
+    with open(path, 'wb') as f:
+        f.write(b'II' + struct.pack('<HI', 42, ifd) + data)
+        f.write(struct.pack('<H', len(tags)) + entries + struct.pack('<I', 0) + spill)
+
+
+LAYOUTS = [{'rows': 7}, {'rows': None}, {'tile': 16}]
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_colour_tiff_matches_pil(tmp_path, layout):
+    pixels = np.random.default_rng(0).integers(0, 256, (45, 37, 3), np.uint8)
+    path = tmp_path / 'rgb.tif'
+    _write_tiff(path, pixels, **layout)
+    raster = open_raster(path)
+    assert isinstance(raster, LazyRaster)
+    for band in range(3):
+        assert np.array_equal(raster[:, :, band], pixels[:, :, band])
+    assert np.array_equal(np.asarray(raster), np.array(Image.open(path)))
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_single_band_tiff_matches_pil(tmp_path, layout):
+    pixels = np.random.default_rng(1).integers(0, 65536, (45, 37), np.uint16)
+    path = tmp_path / 'band.tif'
+    _write_tiff(path, pixels, **layout)
+    band = open_raster(path)
+    assert band.shape == pixels.shape and not band.flags.writeable
+    assert np.array_equal(band, pixels)
+    assert np.array_equal(band, np.array(Image.open(path)))
+
+
+@pytest.mark.parametrize('layout', LAYOUTS)
+def test_float_bands_are_mapped(tmp_path, layout):
+    pixels = np.random.default_rng(2).normal(size=(45, 37, 4)).astype(np.float32)
+    path = tmp_path / 'bands.tif'
+    _write_tiff(path, pixels, **layout)
+    assert np.array_equal(np.asarray(open_raster(path)), pixels)
@@ -0,0 +1,43 @@
+import itertools
+
+import cv2
+import numpy as np
+import pytest
+
+from Thresholding import multi_otsu_thresholds, otsu_threshold
+
+
+def _between_class_score(hist, thresholds):
+    # Sum over classes of (sum of values)**2 / count, classes (t_{c-1}, t_c]
+    levels = np.arange(hist.size)
+    edges = [-1] + list(thresholds) + [hist.size - 1]
+    score = 0.0
+    for lo, hi in zip(edges, edges[1:]):
+        count = hist[lo + 1:hi + 1].sum()
+        if count:
+            score += np.dot(hist[lo + 1:hi + 1], levels[lo + 1:hi + 1]) ** 2 / count
+    return score
+
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('classes', [2, 3, 4])
+def test_multi_otsu_matches_exhaustive_search(seed, classes):
+    rng = np.random.default_rng(seed)
+    hist = rng.integers(0, 50, 24).astype(np.float64)
+    hist[rng.random(24) < 0.3] = 0
+    thresholds = multi_otsu_thresholds(hist, classes)
+    assert len(thresholds) == classes - 1
+    assert thresholds == sorted(thresholds)
+    best = max(_between_class_score(hist, split)
+               for split in itertools.combinations(range(hist.size - 1), classes - 1))
+    assert _between_class_score(hist, thresholds) == pytest.approx(best, rel=1e-12)
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_otsu_threshold_matches_cv2(seed):
+    rng = np.random.default_rng(seed)
+    image = np.concatenate([rng.normal(70, 20, 5000), rng.normal(170, 30, 3000)])
+    image = np.clip(image, 0, 255).astype(np.uint8).reshape(80, 100)
+    expected, _ = cv2.threshold(image, 0, 255, cv2.THRESH_BINARY | cv2.THRESH_OTSU)
+    hist = cv2.calcHist([image], [0], None, [256], [0, 256])
+    assert otsu_threshold(hist) == expected
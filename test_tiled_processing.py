@@ -0,0 +1,38 @@
+import cv2
+import numpy as np
+import pytest
+
+from Tiled_Processing import canny_tiled
+
+
+def _scene():
+    rng = np.random.default_rng(0)
+    image = cv2.GaussianBlur(rng.integers(0, 256, (300, 420), np.uint8), (7, 7), 2)
+    # A weak edge whose only seed lies many tiles away along the same contour
+    image[40:260, 120:] = 60
+    image[40:260, 120:130] = 200
+    return image
+
+
+@pytest.mark.parametrize('tile', [16, 50, 128])
+@pytest.mark.parametrize('low, high', [(100, 300), (300, 100), (20, 60)])
+def test_canny_tiled_matches_whole_image(tile, low, high):
+    image = _scene()
+    expected = cv2.Canny(image, low, high)
+    assert np.array_equal(canny_tiled(image, low, high, tile=tile), expected)
+
+
+@pytest.mark.parametrize('tile', [16, 50])
+def test_canny_tiled_derivative_pair(tile):
+    image = _scene()
+    dx = cv2.Sobel(image, cv2.CV_16S, 1, 0, borderType=cv2.BORDER_REPLICATE)
+    dy = cv2.Sobel(image, cv2.CV_16S, 0, 1, borderType=cv2.BORDER_REPLICATE)
+    expected = cv2.Canny(dx, dy, 20, 60)
+    assert np.array_equal(canny_tiled((dx, dy), 20, 60, tile=tile), expected)
+
+
+def test_canny_tiled_memmap_over_budget(tmp_path):
+    image = _scene()
+    band = np.memmap(tmp_path / 'band.raw', np.uint8, 'w+', shape=image.shape)
+    band[:] = image
+    assert np.array_equal(canny_tiled(band, 100, 300, budget=1 << 16), cv2.Canny(image, 100, 300))